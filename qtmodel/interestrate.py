@@ -8,6 +8,37 @@ from qtmodel.time.frequency import Frequency
 from qtmodel.types import Real
 
 
+def implied_rate_value(compound: Real,
+                       comp: Compounding,
+                       freq: Frequency,
+                       t: Real):
+    """ rate implied by a compound factor over the time t, as a plain number """
+    qt_require(compound > 0.0, "positive compound factor required")
+
+    if compound == 1.0:
+        qt_require(t >= 0.0, f"non negative time ({t}) required")
+        return 0.0
+    qt_require(t > 0.0, f"positive time ({t}) required")
+    if comp == Compounding.Continuous:
+        return math.log(compound) / t
+    elif comp == Compounding.Compounded:
+        return (math.pow(compound, 1.0 / (freq.value * t)) - 1.0) * freq.value
+    elif comp == Compounding.Simple:
+        return (compound - 1.0) / t
+    elif comp == Compounding.SimpleThenCompounded:
+        if t <= 1.0 / freq.value:
+            return (compound - 1.0) / t
+        else:
+            return (math.pow(compound, 1.0 / (freq.value * t)) - 1.0) * freq.value
+    elif comp == Compounding.CompoundedThenSimple:
+        if t > 1.0 / freq.value:
+            return (compound - 1.0) / t
+        else:
+            return (math.pow(compound, 1.0 / (freq.value * t)) - 1.0) * freq.value
+    else:
+        raise QTError(f"unknown compounding convention ({comp.value})")
+
+
 class InterestRate:
     """
     Concrete interest rate class
@@ -110,32 +141,7 @@ class InterestRate:
                      ref_start: datetime = None,
                      ref_end: datetime = None):
         if t is not None:
-            qt_require(compound > 0.0, "positive compound factor required")
-
-            if compound == 1.0:
-                qt_require(t >= 0.0, f"non negative time ({t}) required")
-                r = 0.0
-            else:
-                qt_require(t > 0.0, f"positive time ({t}) required")
-                if comp == Compounding.Simple:
-                    r = (compound - 1.0) / t
-                elif comp == Compounding.Compounded:
-                    r = (math.pow(compound, 1.0 / (freq.value * t)) - 1.0) * freq.value
-                elif comp == Compounding.Continuous:
-                    r = math.log(compound) / t
-                elif comp == Compounding.SimpleThenCompounded:
-                    if t <= 1.0 / freq.value:
-                        r = (compound - 1.0) / t
-                    else:
-                        r = (math.pow(compound, 1.0 / (freq.value * t)) - 1.0) * freq.value
-                elif comp == Compounding.CompoundedThenSimple:
-                    if t > 1.0 / freq.value:
-                        r = (compound - 1.0) / t
-                    else:
-                        r = (math.pow(compound, 1.0 / (freq.value * t)) - 1.0) * freq.value
-                else:
-                    raise QTError(f"unknown compounding convention ({comp.value})")
-            return InterestRate(r, result_dc, comp, freq)
+            return InterestRate(implied_rate_value(compound, comp, freq, t), result_dc, comp, freq)
         elif d1 is not None and d2 is not None:
             qt_require(d2 >= d1, f"d1 ({d1}) later than d2 ({d2})")
             t = result_dc.year_fraction(d1, d2, ref_start, ref_end)
@@ -3,6 +3,8 @@
 class Extrapolator:
     """ base class for classes possibly allowing extrapolation """
 
+    __slots__ = ()
+
     def __init__(self):
         self._extrapolate = False
 
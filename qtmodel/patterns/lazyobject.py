@@ -5,6 +5,8 @@ from qtmodel.patterns.observable import Observable, Observer
 
 class LazyObject(metaclass=ABCMeta):
 
+    __slots__ = ()
+
     def __init__(self):
         super(LazyObject, self).__init__()
         self._calculated = False
@@ -7,6 +7,8 @@ from qtmodel.patterns.singleton import SingletonType
 
 class Observable:
     """ Object that notifies its changes to a set of observers """
+    __slots__ = ('observers_', 'settings_')
+
     def __init__(self):
         self.observers_ = set()
         self.settings_ = ObservableSettings()
@@ -52,6 +54,8 @@ class Observable:
 
 class Observer(metaclass=ABCMeta):
 
+    __slots__ = ()
+
     def __init__(self):
         self.observables_ = []
 
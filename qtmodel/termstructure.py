@@ -11,6 +11,9 @@ from qtmodel.time.daycounter import DayCounter
 from qtmodel.time.timeunit import TimeUnit
 from qtmodel.types import Real
 
+# date/time conversions kept per term structure before the cache is reset
+_TFR_CACHE_SIZE = 1024
+
 
 class TermStructure(Observer, Observable, Extrapolator, metaclass=ABCMeta):
     """
@@ -34,6 +37,9 @@ class TermStructure(Observer, Observable, Extrapolator, metaclass=ABCMeta):
     return the appropriate date.
     """
 
+    __slots__ = ('observables_', '_extrapolate', '_moving', '_updated', '_calendar', '_reference_date',
+                 '_settlement_days', '_day_counter', '_tfr_reference', '_tfr_cache', '_version')
+
     def __init__(self,
                  reference_date: datetime = None,
                  settlement_days: int = None,
@@ -49,6 +55,11 @@ class TermStructure(Observer, Observable, Extrapolator, metaclass=ABCMeta):
         self._reference_date = None
         self._settlement_days = None
         self._day_counter = None
+        # date/time conversions from _tfr_reference, keyed on date
+        self._tfr_reference = None
+        self._tfr_cache = {}
+        # bumped on every notification; lets derived classes key memoized results
+        self._version = 0
 
         # Three scenarios
         # initialize with a fixed reference date
@@ -76,7 +87,17 @@ class TermStructure(Observer, Observable, Extrapolator, metaclass=ABCMeta):
 
     def time_from_reference(self, date: datetime):
         """ date/time conversion """
-        return self.day_counter().year_fraction(self.reference_date(), date)
+        reference_date = self.reference_date()
+        if reference_date != self._tfr_reference:
+            self._tfr_cache.clear()
+            self._tfr_reference = reference_date
+        t = self._tfr_cache.get(date)
+        if t is None:
+            if len(self._tfr_cache) >= _TFR_CACHE_SIZE:
+                self._tfr_cache.clear()
+            t = self.day_counter().year_fraction(reference_date, date)
+            self._tfr_cache[date] = t
+        return t
 
     def settlement_days(self):
         qt_require(self._settlement_days is not None,
@@ -104,8 +125,11 @@ class TermStructure(Observer, Observable, Extrapolator, metaclass=ABCMeta):
         return self.time_from_reference(self.max_date())
 
     def update(self):
+        self._version += 1
         if self._moving:
             self._updated = False
+        # the reference date or the day counter may have changed
+        self._tfr_cache.clear()
         self.notify_observers()
 
     def check_range(self,
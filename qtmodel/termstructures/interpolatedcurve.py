@@ -1,6 +1,8 @@
 from datetime import datetime
 from typing import List
 
+import numpy as np
+
 from qtmodel.error import QTError
 from qtmodel.math.interpolation import Interpolation
 from qtmodel.types import Real
@@ -14,6 +16,8 @@ class InterpolatedCurve:
     members and implement correct copy behavior.
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  class_type,
                  times: List[Real] = None,
@@ -36,6 +40,10 @@ class InterpolatedCurve:
             raise QTError("it's not in the four scenarios")
 
         self._interpolation: Interpolation = None
+        # contiguous float64 copies of the nodes for vectorized code; the
+        # lists above stay authoritative since interpolations index them
+        self._times_arr: np.ndarray = None
+        self._data_arr: np.ndarray = None
         # Usually, the maximum date is the one corresponding to the
         # last node. However, it might happen that a bit of
         # extrapolation is used by construction; for instance, when a
@@ -50,3 +58,8 @@ class InterpolatedCurve:
     def setup_interpolation(self):
         self._interpolation = self._interpolator.interpolate(self._times,
                                                              self._data)
+        self.update_arrays()
+
+    def update_arrays(self):
+        self._times_arr = np.asarray(self._times, dtype=np.float64)
+        self._data_arr = np.asarray(self._data, dtype=np.float64)
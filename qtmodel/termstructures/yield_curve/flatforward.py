@@ -1,8 +1,9 @@
+import math
 from datetime import datetime
 from typing import Union
 
 from qtmodel.compounding import Compounding
-from qtmodel.error import QTError
+from qtmodel.error import QTError, qt_require
 from qtmodel.handle import Handle
 from qtmodel.interestrate import InterestRate
 from qtmodel.patterns.lazyobject import LazyObject
@@ -17,6 +18,10 @@ from qtmodel.types import Real
 class FlatForward(YieldTermStructure, LazyObject):
     """ Flat interest-rate curve """
 
+    __slots__ = ('_calculated', '_frozen', '_always_forward',
+                 '_forward', '_compounding', '_frequency',
+                 '_rate', '_minus_r', '_base', '_df_exp')
+
     def __init__(self,
                  reference_date: datetime = None,
                  settlement_days: int = None,
@@ -25,61 +30,50 @@ class FlatForward(YieldTermStructure, LazyObject):
                  day_counter: DayCounter = None,
                  compounding: Compounding = Compounding.Continuous,
                  frequency: Frequency = Frequency.Annual):
-        if reference_date is not None and forward is not None and \
-                day_counter is not None and compounding is not None and \
-                frequency is not None and settlement_days is None and \
-                calendar is None:
-            if isinstance(forward, Handle):
-                YieldTermStructure.__init__(self,
-                                            reference_date=reference_date,
-                                            cal=None,
-                                            dc=day_counter)
-                LazyObject.__init__(self)
-                self._forward = forward
-                self._compounding = compounding
-                self._frequency = frequency
-                self.register_with(self._forward)
-
-            elif isinstance(forward, (int, float)):
-                YieldTermStructure.__init__(self,
-                                            reference_date=reference_date,
-                                            cal=None,
-                                            dc=day_counter)
-                LazyObject.__init__(self)
-                self._forward = SimpleQuote(value=forward)
-                self._compounding = compounding
-                self._frequency = frequency
-            else:
-                raise QTError("forward must be handle or real")
-        elif reference_date is None and forward is not None and \
-                day_counter is not None and compounding is not None and \
-                frequency is not None and settlement_days is not None and \
-                calendar is not None:
-            if isinstance(forward, Handle):
-                YieldTermStructure.__init__(self,
-                                            settlement_days=settlement_days,
-                                            cal=calendar,
-                                            dc=day_counter)
-                LazyObject.__init__(self)
-                self._forward = forward
-                self._compounding = compounding
-                self._frequency = frequency
-                self.register_with(self._forward)
-            elif isinstance(forward, (int, float)):
-                YieldTermStructure.__init__(self,
-                                            settlement_days=settlement_days,
-                                            cal=calendar,
-                                            dc=day_counter)
-                LazyObject.__init__(self)
-                self._forward = SimpleQuote(forward)
-                self._compounding = compounding
-                self._frequency = frequency
-            else:
-                raise QTError("forward must be handle or real")
-        else:
+        qt_require(forward is not None and day_counter is not None and
+                   compounding is not None and frequency is not None,
+                   "forward, day counter, compounding and frequency must be given")
+        # bit 0: reference date, bit 1: settlement days, bit 2: calendar
+        mask = (reference_date is not None) | \
+               (settlement_days is not None) << 1 | \
+               (calendar is not None) << 2
+        init = self._DISPATCH.get(mask)
+        if init is None:
             raise QTError("it's not in the four scenarios")
+        is_handle = isinstance(forward, Handle)
+        if not is_handle:
+            if not isinstance(forward, (int, float)):
+                raise QTError("forward must be handle or real")
+            forward = SimpleQuote(forward)
+
+        init(self, reference_date, settlement_days, calendar, day_counter)
+        LazyObject.__init__(self)
+        self._forward = forward
+        self._compounding = compounding
+        self._frequency = frequency
+        if is_handle:
+            self.register_with(self._forward)
 
         self._rate: InterestRate = None
+        # closed-form discount parameters, set in perform_calculations
+        self._minus_r: Real = None
+        self._base: Real = None
+        self._df_exp: Real = None
+
+    def _init_from_reference_date(self, reference_date, settlement_days, calendar, day_counter):
+        YieldTermStructure.__init__(self,
+                                    reference_date=reference_date,
+                                    cal=None,
+                                    dc=day_counter)
+
+    def _init_from_settlement_days(self, reference_date, settlement_days, calendar, day_counter):
+        YieldTermStructure.__init__(self,
+                                    settlement_days=settlement_days,
+                                    cal=calendar,
+                                    dc=day_counter)
+
+    _DISPATCH = {0b001: _init_from_reference_date,
+                 0b110: _init_from_settlement_days}
 
     def compounding(self):
         return self._compounding
@@ -97,10 +91,34 @@ class FlatForward(YieldTermStructure, LazyObject):
 
     def discount_impl(self, t: Real):
         self.calculate()
+        if self._minus_r is not None:
+            return math.exp(self._minus_r * t)
+        if self._base is not None:
+            return self._base ** (self._df_exp * t)
         return self._rate.discount_factor(t)
 
+    def instantaneous_rate(self, extrapolate: bool = False):
+        self.calculate()
+        if self._minus_r is not None:
+            return -self._minus_r
+        if self._base is not None:
+            return -self._df_exp * math.log(self._base)
+        return super().instantaneous_rate(extrapolate)
+
     def perform_calculations(self):
-        self._rate = InterestRate(r=self._forward.value(),
+        r = self._forward.value()
+        self._rate = InterestRate(r=r,
                                   dc=None,
                                   comp=self._compounding,
                                   freq=self._frequency)
+        # constant compounding allows the discount factor to be
+        # computed without going through InterestRate
+        self._minus_r = None
+        self._base = None
+        self._df_exp = None
+        if self._compounding == Compounding.Continuous:
+            self._minus_r = -r
+        elif self._compounding == Compounding.Compounded:
+            f = self._frequency.value
+            self._base = 1.0 + r / f
+            self._df_exp = -f
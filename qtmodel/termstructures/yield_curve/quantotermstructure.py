@@ -1,3 +1,5 @@
+from typing import List
+
 from qtmodel.compounding import Compounding
 from qtmodel.handle import Handle
 from qtmodel.termstructures.yield_curve.zeroyieldstructure import ZeroYieldStructure
@@ -7,6 +9,12 @@ from qtmodel.types import Real
 
 class QuantoTermStructure(ZeroYieldStructure):
 
+    __slots__ = ('_underlying_dividend_ts', '_risk_free_ts', '_foreign_risk_free_ts',
+                 '_underlying_black_vol_ts', '_exch_rate_black_vol_ts',
+                 '_underlying_exch_rate_correlation', '_strike', '_exch_rate_atmlevel',
+                 '_all_handles', '_last_zero_yield', '_max_date_cache',
+                 '_dc_cache', '_calendar_cache', '_ref_cache')
+
     def __init__(self,
                  underlying_dividend_ts: Handle,
                  risk_free_ts: Handle,
@@ -16,7 +24,7 @@ class QuantoTermStructure(ZeroYieldStructure):
                  exch_rate_black_vol_ts: Handle,
                  exch_rate_atmlevel: Real,
                  underlying_exch_rate_correlation: Real):
-        super().__init__(underlying_dividend_ts.day_counter())
+        super().__init__(dc=underlying_dividend_ts.day_counter())
 
         self._underlying_dividend_ts = underlying_dividend_ts
         self._risk_free_ts = risk_free_ts
@@ -27,41 +35,82 @@ class QuantoTermStructure(ZeroYieldStructure):
         self._underlying_exch_rate_correlation = underlying_exch_rate_correlation
         self._strike = strike
         self._exch_rate_atmlevel = exch_rate_atmlevel
-        self.register_with(self._underlying_dividend_ts)
-        self.register_with(self._risk_free_ts)
-        self.register_with(self._foreign_risk_free_ts)
-        self.register_with(self._underlying_black_vol_ts)
-        self.register_with(self._exch_rate_black_vol_ts)
+        self._all_handles = (self._underlying_dividend_ts,
+                             self._risk_free_ts,
+                             self._foreign_risk_free_ts,
+                             self._underlying_black_vol_ts,
+                             self._exch_rate_black_vol_ts)
+        # last (t, zero yield) pair and max date, reset whenever an underlying changes
+        self._last_zero_yield = None
+        self._max_date_cache = None
+        # (version, value) pairs for the data forwarded from the dividend curve
+        self._dc_cache = (-1, None)
+        self._calendar_cache = (-1, None)
+        self._ref_cache = (-1, None)
+        # register with the links rather than the linked curves, so that
+        # relinking a handle resets the caches as well
+        for h in self._all_handles:
+            self.register_with(h._link)
 
     def day_counter(self):
-        return self._underlying_dividend_ts.day_counter()
+        version, dc = self._dc_cache
+        if version != self._version:
+            dc = self._underlying_dividend_ts.day_counter()
+            self._dc_cache = (self._version, dc)
+        return dc
 
     def calendar(self):
-        return self._underlying_dividend_ts.calendar()
+        version, cal = self._calendar_cache
+        if version != self._version:
+            cal = self._underlying_dividend_ts.calendar()
+            self._calendar_cache = (self._version, cal)
+        return cal
 
     def settlement_days(self):
         return self._underlying_dividend_ts.settlement_days()
 
     def reference_date(self):
-        return self._underlying_dividend_ts.reference_date()
+        version, ref = self._ref_cache
+        if version != self._version:
+            ref = self._underlying_dividend_ts.reference_date()
+            self._ref_cache = (self._version, ref)
+        return ref
 
     def max_date(self):
-        max_date = min(self._underlying_dividend_ts.max_date(), self._risk_free_ts.max_date())
-        max_date = min(max_date, self._foreign_risk_free_ts.max_date())
-        max_date = min(max_date, self._underlying_black_vol_ts.max_date())
-        max_date = min(max_date, self._exch_rate_black_vol_ts.max_date())
-        return max_date
+        if self._max_date_cache is None:
+            self._max_date_cache = min(h.max_date() for h in self._all_handles)
+        return self._max_date_cache
+
+    def update(self):
+        self._last_zero_yield = None
+        self._max_date_cache = None
+        super().update()
 
     # ! returns the zero yield as seen from the evaluation date
 
-    def zero_yield_impl(self, t):
-        return self._underlying_dividend_ts.zero_rate(t=t, comp=Compounding.Continuous, freq=Frequency.NoFrequency,
-                                                      extrapolate=True) + self._risk_free_ts.zero_rate(t=t,
-                                                                                                       comp=Compounding.Continuous,
-                                                                                                       freq=Frequency.NoFrequency,
-                                                                                                       extrapolate=True) - self._foreign_risk_free_ts.zero_rate(
-            t=t, comp=Compounding.Continuous, freq=Frequency.NoFrequency,
-            extrapolate=True) + self._underlying_exch_rate_correlation * self._underlying_black_vol_ts.black_vol(
-            maturity=t, strike=self._strike, extrapolate=True) * self._exch_rate_black_vol_ts.black_vol(maturity=t,
-                                                                                                        strike=self._exch_rate_atmlevel,
-                                                                                                        extrapolate=True)
+    def zero_yield_impl(self, t: Real):
+        last = self._last_zero_yield
+        if last is not None and last[0] == t:
+            return last[1]
+        result = self.zero_yield_impl_many([t])[0]
+        self._last_zero_yield = (t, result)
+        return result
+
+    def zero_yield_impl_many(self, ts: List[Real]):
+        """ zero yields for a whole time grid, resolving the underlying structures once """
+        udts = self._underlying_dividend_ts.current_link()
+        rfts = self._risk_free_ts.current_link()
+        ffts = self._foreign_risk_free_ts.current_link()
+        uvol = self._underlying_black_vol_ts.current_link()
+        xvol = self._exch_rate_black_vol_ts.current_link()
+        rho = self._underlying_exch_rate_correlation
+        strike = self._strike
+        atm = self._exch_rate_atmlevel
+        comp = Compounding.Continuous
+        freq = Frequency.NoFrequency
+        return [udts.zero_rate(t=t, comp=comp, freq=freq, extrapolate=True).rate() +
+                rfts.zero_rate(t=t, comp=comp, freq=freq, extrapolate=True).rate() -
+                ffts.zero_rate(t=t, comp=comp, freq=freq, extrapolate=True).rate() +
+                rho * uvol.black_vol(maturity=t, strike=strike, extrapolate=True) *
+                xvol.black_vol(maturity=t, strike=atm, extrapolate=True)
+                for t in ts]
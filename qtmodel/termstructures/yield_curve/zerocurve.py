@@ -1,11 +1,16 @@
+import bisect
+import math
 from datetime import datetime
-from typing import List, Tuple
+from typing import List
+
+import numpy as np
 
 from qtmodel.compounding import Compounding
 from qtmodel.error import QTError, qt_require
 from qtmodel.handle import Handle
 from qtmodel.interestrate import InterestRate
 from qtmodel.math.comparison import close
+from qtmodel.math.interpolations.linearinterpolation import Linear
 from qtmodel.termstructures.interpolatedcurve import InterpolatedCurve
 from qtmodel.termstructures.yield_curve.zeroyieldstructure import ZeroYieldStructure
 from qtmodel.time.calendar import Calendar
@@ -14,9 +19,29 @@ from qtmodel.time.frequency import Frequency
 from qtmodel.types import Real
 
 
+def _linear_zero_discount(t: Real, times: List[Real], data: List[Real], slopes: List[Real]):
+    """
+    discount factor off linearly-interpolated zero rates, with flat-forward
+    extrapolation past the last node, evaluated in a single frame
+    """
+    if t == 0.0:
+        return 1.0
+    t_max = times[-1]
+    if t > t_max:
+        z_max = data[-1]
+        inst_fwd_max = z_max + t_max * slopes[-1]
+        return math.exp(-(z_max * t_max + inst_fwd_max * (t - t_max)))
+    i = bisect.bisect_right(times, t, 0, len(times) - 1) - 1
+    return math.exp(-(data[i] + (t - times[i]) * slopes[i]) * t)
+
+
 class InterpolatedZeroCurve(ZeroYieldStructure, InterpolatedCurve):
     """ YieldTermStructure based on interpolation of zero rates """
 
+    __slots__ = ('_interpolator', '_times', '_data', '_interpolation', '_max_date',
+                 '_times_arr', '_data_arr',
+                 '_class_type', '_dates', '_dates_arr', '_slopes')
+
     def __init__(self,
                  class_type,
                  dates: List[datetime] = None,
@@ -32,6 +57,9 @@ class InterpolatedZeroCurve(ZeroYieldStructure, InterpolatedCurve):
                  frequency: Frequency = Frequency.Annual):
         self._class_type = class_type
         self._dates = None
+        self._dates_arr = None
+        # segment slopes, only set when interpolating linearly
+        self._slopes: List[Real] = None
         if dates is not None and yields is not None:
             if jumps is not None and jump_dates is not None:
                 if interpolator is None:
@@ -104,37 +132,51 @@ class InterpolatedZeroCurve(ZeroYieldStructure, InterpolatedCurve):
         qt_require(len(self._data) == len(self._dates),
                    "dates/data count mismatch")
 
-        self._times[0] = 0.0
-        if compounding != Compounding.Continuous:
-            # We also have to convert the first rate.
-            # The first time is 0.0, so we can't use it.
-            # We fall back to about one day.
-            dt = 1.0 / 365
-            r = InterestRate(self._data[0], self.day_counter(), compounding, frequency)
-            self._data[0] = r.equivalent_rate(comp=Compounding.Continuous,
-                                              freq=Frequency.NoFrequency,
-                                              t=dt)
-
-        for i in range(1, len(self._dates)):
-            qt_require(self._dates[i] > self._dates[i - 1],
-                       f"invalid date ({self._dates[i]} vs {self._dates[i - 1]})")
-            self._times[i] = self.day_counter().year_fraction(self._dates[0], self._dates[i])
-            qt_require(not close(self._times[i], self._times[i - 1]),
-                       "two dates correspond to the same time "
-                       "under this curve's day count convention")
+        dates = self._dates
+        data = self._data
+        dc = self.day_counter()
+        convert = compounding != Compounding.Continuous
+        times = [0.0] * len(dates)
+        for i in range(len(dates)):
+            if i == 0:
+                # The first time is 0.0, so we can't use it to convert
+                # the first rate. We fall back to about one day.
+                t = 1.0 / 365
+            else:
+                qt_require(dates[i] > dates[i - 1],
+                           f"invalid date ({dates[i]} vs {dates[i - 1]})")
+                t = times[i] = dc.year_fraction(dates[0], dates[i])
+                qt_require(not close(t, times[i - 1]),
+                           "two dates correspond to the same time "
+                           "under this curve's day count convention")
 
             # adjusting zero rates to match continuous compounding
-            if compounding != Compounding.Continuous:
-                r = InterestRate(self._data[i], self.day_counter(), compounding, frequency)
-                self._data[i] = r.equivalent_rate(comp=Compounding.Continuous,
-                                                  freq=Frequency.NoFrequency,
-                                                  t=self._times[i])
+            if convert:
+                r = InterestRate(data[i], dc, compounding, frequency)
+                data[i] = r.equivalent_rate(comp=Compounding.Continuous,
+                                            freq=Frequency.NoFrequency,
+                                            t=t).rate()
+        self._times = times
 
         self._interpolation = self._interpolator.interpolate(self._times, self._data)
         self._interpolation.update()
+        self._dates_arr = np.array(self._dates, dtype='datetime64[D]')
+        self.update_arrays()
+        if isinstance(self._interpolator, Linear):
+            self._slopes = [(self._data[i] - self._data[i - 1]) / (self._times[i] - self._times[i - 1])
+                            for i in range(1, len(self._times))]
+
+    def discount_impl(self, t: Real):
+        if self._slopes is not None:
+            return _linear_zero_discount(t, self._times, self._data, self._slopes)
+        return super().discount_impl(t)
 
     def zero_yield_impl(self, t: Real):
         if t <= self._times[-1]:
+            if self._slopes is not None:
+                times = self._times
+                i = bisect.bisect_right(times, t, 0, len(times) - 1) - 1
+                return self._data[i] + (t - times[i]) * self._slopes[i]
             return self._interpolation(t, True)
 
         # flat fwd extrapolation
@@ -143,6 +185,9 @@ class InterpolatedZeroCurve(ZeroYieldStructure, InterpolatedCurve):
         inst_fwd_max = z_max + t_max * self._interpolation.derivative(t_max)
         return (z_max * t_max + inst_fwd_max * (t - t_max)) / t
 
+    def instantaneous_rate(self, extrapolate: bool = False):
+        return self._data[0]
+
     def times(self):
         return self._times
 
@@ -156,10 +201,20 @@ class InterpolatedZeroCurve(ZeroYieldStructure, InterpolatedCurve):
         return self._data
 
     def nodes(self):
-        results: List[Tuple[datetime, Real]] = [None] * len(self._dates)
-        for i in range(len(self._dates)):
-            results[i] = (self._dates[i], self._data[i])
-        return results
+        return list(zip(self._dates, self._data))
+
+    def times_array(self):
+        return self._times_arr
+
+    def dates_array(self):
+        return self._dates_arr
+
+    def zero_rates_array(self):
+        return self._data_arr
+
+    def nodes_soa(self):
+        """ node dates and zero rates as parallel arrays """
+        return self._dates_arr, self._data_arr
 
     def max_date(self):
         if self._max_date is not None:
@@ -12,6 +12,8 @@ from qtmodel.types import Real
 
 class ZeroYieldStructure(YieldTermStructure):
 
+    __slots__ = ()
+
     def __init__(self,
                  ref_date: datetime = None,
                  settlement_days: int = None,
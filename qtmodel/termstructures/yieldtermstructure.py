@@ -1,3 +1,4 @@
+import bisect
 from abc import ABCMeta, abstractmethod
 from datetime import datetime
 from typing import List, Union, Optional
@@ -5,7 +6,7 @@ from typing import List, Union, Optional
 from qtmodel.compounding import Compounding
 from qtmodel.error import QTError, qt_require
 from qtmodel.handle import Handle
-from qtmodel.interestrate import InterestRate
+from qtmodel.interestrate import InterestRate, implied_rate_value
 from qtmodel.termstructure import TermStructure
 from qtmodel.time.calendar import Calendar
 from qtmodel.time.date import DateTool
@@ -21,6 +22,9 @@ class YieldTermStructure(TermStructure, metaclass=ABCMeta):
     This abstract class defines the interface of concrete
     interest rate structures which will be derived from this one.
     """
+
+    __slots__ = ('_jumps', '_jump_dates', '_jump_times', '_n_jumps',
+                 '_jump_order', '_jump_times_sorted', '_latest_reference')
     dt = 0.0001
 
     def __init__(self,
@@ -52,6 +56,12 @@ class YieldTermStructure(TermStructure, metaclass=ABCMeta):
                 self.register_with(self._jumps[i])
         elif dc is not None:
             super().__init__(day_counter=dc)
+            self._jumps = []
+            self._jump_dates = []
+            self._jump_times = []
+            self._n_jumps = 0
+            self._jump_order = []
+            self._jump_times_sorted = []
         else:
             raise QTError("it's not in the three scenarios")
         self._latest_reference = None
@@ -59,24 +69,29 @@ class YieldTermStructure(TermStructure, metaclass=ABCMeta):
     def discount(self,
                  d: Union[datetime, Real],
                  extrapolate: bool = False):
-        if isinstance(d, datetime):
-            return self.discount(self.time_from_reference(d), extrapolate)
-        elif isinstance(d, (int, float)):
-            self.check_range(t=d, extrapolate=extrapolate)
+        # times are by far the most common argument, so test for them first
+        if type(d) is not float and isinstance(d, datetime):
+            d = self.time_from_reference(d)
+        return self._discount_t(d, extrapolate)
 
-            if len(self._jumps) == 0:
-                return self.discount_impl(d)
+    def _discount_t(self, t: Real, extrapolate: bool):
+        self.check_range(t=t, extrapolate=extrapolate)
 
-            jump_effect = 1.0
-            for i in range(self._n_jumps):
-                if 0 < self._jump_times[i] < d:
-                    qt_require(self._jumps[i].is_valid(),
-                               f"invalid jump quote index: {i}")
-                    this_jump = self._jumps[i].value()
-                    qt_require(this_jump > 0.0,
-                               f"invalid jump value index: {i}; value: {this_jump}")
-                    jump_effect *= this_jump
-            return jump_effect * self.discount_impl(d)
+        if self._n_jumps == 0:
+            return self.discount_impl(t)
+
+        # only jumps with 0 < time < t contribute
+        lo = bisect.bisect_right(self._jump_times_sorted, 0.0)
+        hi = bisect.bisect_left(self._jump_times_sorted, t)
+        jump_effect = 1.0
+        for i in self._jump_order[lo:hi]:
+            qt_require(self._jumps[i].is_valid(),
+                       f"invalid jump quote index: {i}")
+            this_jump = self._jumps[i].value()
+            qt_require(this_jump > 0.0,
+                       f"invalid jump value index: {i}; value: {this_jump}")
+            jump_effect *= this_jump
+        return jump_effect * self.discount_impl(t)
 
     @abstractmethod
     def discount_impl(self, t: Real):
@@ -85,19 +100,23 @@ class YieldTermStructure(TermStructure, metaclass=ABCMeta):
 
     def set_jumps(self, reference_date: datetime):
         if len(self._jump_dates) == 0 and len(self._jumps) != 0:  # turn of year dates
-            self._jump_dates: List[Optional[datetime]] = [None] * self._n_jumps
-            self._jump_times: List[Optional[Real]] = [None] * self._n_jumps
             y = reference_date.year
-            for i in range(self._n_jumps):
-                self._jump_dates[i] = datetime(y + i, 12, 31)
+            self._jump_dates = [datetime(y + i, 12, 31) for i in range(self._n_jumps)]
         else:  # fixed dates
             qt_require(len(self._jump_dates) == self._n_jumps,
                        f"mismatch between number of jumps ({self._n_jumps}) and jump dates ({len(self._jump_dates)})")
 
-        for i in range(self._n_jumps):
-            self._jump_times[i] = self.time_from_reference(self._jump_dates[i])
+        self._jump_times = [self.time_from_reference(d) for d in self._jump_dates]
+        # jump indices ordered by time, so that discount() can bisect
+        self._jump_order = sorted(range(self._n_jumps), key=self._jump_times.__getitem__)
+        self._jump_times_sorted = [self._jump_times[i] for i in self._jump_order]
         self._latest_reference = reference_date
 
+    def instantaneous_rate(self, extrapolate: bool = False):
+        """ continuously-compounded zero rate at the reference date """
+        compound = 1.0 / self.discount(self.dt, extrapolate)
+        return implied_rate_value(compound, Compounding.Continuous, Frequency.NoFrequency, self.dt)
+
     def zero_rate(self,
                   d: datetime = None,
                   t: Real = None,
@@ -109,6 +128,8 @@ class YieldTermStructure(TermStructure, metaclass=ABCMeta):
                 comp is not None and freq is not None and \
                 extrapolate is not None:
             if d == self.reference_date():
+                if comp == Compounding.Continuous:
+                    return InterestRate(self.instantaneous_rate(extrapolate), day_counter, comp, freq)
                 compound = 1.0 / self.discount(self.dt, extrapolate)
                 # t has been calculated with a possibly different daycounter
                 # but the difference should not matter for very small times
@@ -127,13 +148,12 @@ class YieldTermStructure(TermStructure, metaclass=ABCMeta):
         elif t is not None and comp is not None and \
                 freq is not None and extrapolate is not None:
             if t == 0.0:
+                if comp == Compounding.Continuous:
+                    return InterestRate(self.instantaneous_rate(extrapolate), self.day_counter(), comp, freq)
                 t = self.dt
             compound = 1.0 / self.discount(t, extrapolate)
-            return InterestRate.implied_rate(compound=compound,
-                                             result_dc=self.day_counter(),
-                                             comp=comp,
-                                             freq=freq,
-                                             t=t)
+            return InterestRate(implied_rate_value(compound, comp, freq, t),
+                                self.day_counter(), comp, freq)
         else:
             raise QTError("it's not in the two scenarios")
 
@@ -182,11 +202,8 @@ class YieldTermStructure(TermStructure, metaclass=ABCMeta):
             else:
                 qt_require(t2 > t1, f"t2 ({t2}) < t1 ({t2})")
                 compound = self.discount(t1, extrapolate) / self.discount(t2, extrapolate)
-            return InterestRate.implied_rate(compound=compound,
-                                             result_dc=self.day_counter(),
-                                             comp=comp,
-                                             freq=freq,
-                                             t=t2 - t1)
+            return InterestRate(implied_rate_value(compound, comp, freq, t2 - t1),
+                                self.day_counter(), comp, freq)
         elif d is not None and p is not None and \
                 day_counter is not None and comp is not None and \
                 freq is not None and extrapolate is not None:
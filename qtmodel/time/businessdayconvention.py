@@ -1,7 +1,7 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 
-class BusinessDayConvention(Enum):
+class BusinessDayConvention(IntEnum):
     """ These conventions specify the algorithm used to adjust a date in case
     it is not a valid business day. """
     # ISDA
@@ -29,3 +29,6 @@ class BusinessDayConvention(Enum):
     # If both the preceding and following business days are
     # equally far away, default to following business day.
     Nearest = 7
+
+    # render as BusinessDayConvention.Following, not as the int value
+    __str__ = Enum.__str__
@@ -1,10 +1,14 @@
 from abc import ABCMeta, abstractmethod
+from array import array
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
+
+import numpy as np
 
 from qtmodel.error import QTError, qt_require
 from qtmodel.time.businessdayconvention import BusinessDayConvention
-from qtmodel.time.date import DateTool
+from qtmodel.time.date import DateTool, _month_length, _weekday, _year_start
 from qtmodel.time.period import Period
 from qtmodel.time.timeunit import TimeUnit
 from qtmodel.time.weekday import Weekday
@@ -29,12 +33,25 @@ class CalendarTypes(Enum):
     NONE = "None"
 
 
+# weekdays as numbered by date.weekday()
+_MON, _TUE, _WED, _THU, _FRI, _SAT, _SUN = range(7)
+
+
+# Saturday and Sunday as bits of the Weekday values
+_WEEKEND_MASK = 1 << Weekday.Saturday.value | 1 << Weekday.Sunday.value
+
+
+def _monday_on_or_after(ordinal: int) -> int:
+    return ordinal + (_MON - _weekday(ordinal)) % 7
+
+
 class EasterMondayTypes(Enum):
     Western = "Western"
     Orthodox = "Orthodox"
 
 
-western_easter_monday = [
+# day of the year of Easter Monday, one byte per year
+western_easter_monday = array('B', [
     98, 90, 103, 95, 114, 106, 91, 111, 102,  # 1901-1909
     87, 107, 99, 83, 103, 95, 115, 99, 91, 111,  # 1910-1919
     96, 87, 107, 92, 112, 103, 95, 108, 100, 91,  # 1920-1929
@@ -65,9 +82,9 @@ western_easter_monday = [
     92, 112, 104, 95, 108, 100, 92, 111, 96, 88,  # 2170-2179
     108, 92, 112, 104, 89, 108, 100, 85, 105, 96,  # 2180-2189
     116, 101, 93, 112, 97, 89, 109, 100, 85, 105  # 2190-2199
-]
+])
 
-orthodox_easter_monday = [
+orthodox_easter_monday = array('B', [
     105, 118, 110, 102, 121, 106, 126, 118, 102,  # 1901-1909
     122, 114, 99, 118, 110, 95, 115, 106, 126, 111,  # 1910-1919
     103, 122, 107, 99, 119, 110, 123, 115, 107, 126,  # 1920-1929
@@ -98,102 +115,323 @@ orthodox_easter_monday = [
     99, 119, 111, 130, 115, 107, 127, 111, 103, 123,  # 2170-2179
     108, 99, 119, 104, 124, 115, 100, 120, 112, 103,  # 2180-2189
     116, 108, 128, 119, 104, 124, 116, 100, 120, 112  # 2190-2199
-]
+])
+
+# Western Easter Monday as day ordinals, indexed by year - 1901
+_western_easter_monday_ordinals = array('l', [_year_start(1901 + i) + day - 1
+                                              for i, day in enumerate(western_easter_monday)])
 
 
 class Calendar(metaclass=ABCMeta):
+    __slots__ = ('calendar_type', '_name')
+
+    # holiday ordinals per (calendar type, year), filled lazily by
+    # _year_holidays for calendars implementing _build_year
+    _holiday_cache = {}
+    # intrinsic holiday flags (weekends included) for each day of the year,
+    # keyed on (calendar type, year)
+    _holiday_mask_cache = {}
+    # running count of business days through each day of the year, keyed on
+    # (calendar type, year); unlike the masks, these include user-defined changes
+    _business_day_count_cache = {}
+    # intrinsic business days of the year as packed bits, keyed on (calendar type, year)
+    _business_day_bitmap_cache = {}
+    # whether the holidays depend on the calendar type alone, so that the
+    # per-year caches above can be shared
+    _fixed_rules = True
+    # number of user-defined changes made to any calendar so far, so that
+    # caches built on top of other calendars can tell when they are stale
+    _changes = 0
 
     def __init__(self, calendar_type: CalendarTypes):
         self.calendar_type = calendar_type
+        self._name = calendar_type.value
 
     def add_holiday(self, date: datetime):
+        # user-defined changes are kept as day ordinals, whatever the time of day
+        ordinal = date.toordinal()
         # if date was a genuine holiday previously removed, revert the change
-        self.removed_holidays.discard(date)
+        self.removed_holidays.discard(ordinal)
         # if it's already a holiday, leave the calendar alone.
         # Otherwise, add it.
-        if self.is_business_day(date=date):
-            self.added_holidays.add(date)
+        if self.is_business_day(date):
+            self.added_holidays.add(ordinal)
+        self._business_day_count_cache.clear()
+        Calendar._changes += 1
 
     def remove_holiday(self, date: datetime):
+        ordinal = date.toordinal()
         # if d was an artificially-added holiday, revert the change
-        self.added_holidays.discard(date)
+        self.added_holidays.discard(ordinal)
         # if it's already a business day, leave the calendar alone.
         # Otherwise, add it.
-        if not self.is_business_day(date=date):
-            self.removed_holidays.add(date)
+        if not self.is_business_day(date):
+            self.removed_holidays.add(ordinal)
+        self._business_day_count_cache.clear()
+        Calendar._changes += 1
 
     def name(self) -> str:
-        return self.calendar_type.value
+        return self._name
 
     def is_business_day(self, date: datetime) -> bool:
         """
         :param date:
         :return:
         """
-        if date in self.added_holidays:
+        return self._is_business_ordinal(date.toordinal(), date.year)
+
+    def _is_business_ordinal(self, ordinal: int, year: int) -> bool:
+        """
+        :param ordinal: day ordinal, as returned by date.toordinal()
+        :param year: year of that day
+        :return: whether the day is a business day
+        """
+        if ordinal in self.added_holidays:
             return False
-        if date in self.removed_holidays:
+        if ordinal in self.removed_holidays:
             return True
-        return self._is_business_day(date=date)
+        if not self._fixed_rules:
+            return self._is_business_day(datetime.fromordinal(ordinal))
+        # the intrinsic rules never change, so they are answered from packed bits;
+        # user-defined changes are checked before reaching them
+        key = (self.calendar_type, year)
+        bitmap = self._business_day_bitmap_cache.get(key)
+        if bitmap is None:
+            bitmap = self._build_business_day_bitmap(year)
+            self._business_day_bitmap_cache[key] = bitmap
+        first, bits = bitmap
+        i = ordinal - first
+        return bool(bits[i >> 3] >> (i & 7) & 1)
 
     @abstractmethod
     def _is_business_day(self, date: datetime) -> bool:
         pass
 
+    def _build_business_day_bitmap(self, year: int):
+        """
+        :param year:
+        :return: ordinal of January 1st, and the intrinsic business days of the year
+                 packed eight to a byte, least significant bit first
+        """
+        bits = np.packbits(~self._year_holiday_mask(year), bitorder='little')
+        return _year_start(year), bits.tobytes()
+
+    def _build_year(self, year: int):
+        """
+        :param year:
+        :return: ordinals of the non-weekend holidays of the given year
+        """
+        raise QTError(f"{self.name()} calendar does not build yearly holiday sets")
+
+    def _year_holidays(self, year: int) -> frozenset:
+        """
+        :param year:
+        :return: ordinals of the holidays in the given year, built once per calendar type
+        """
+        key = (self.calendar_type, year)
+        holidays = self._holiday_cache.get(key)
+        if holidays is None:
+            holidays = frozenset(self._build_year(year))
+            self._holiday_cache[key] = holidays
+        return holidays
+
     def is_holiday(self, date: datetime) -> bool:
-        return not self.is_business_day(date=date)
+        return not self.is_business_day(date)
 
     @staticmethod
     def is_weekend(w: Weekday) -> bool:
-        return w == Weekday.Saturday or w == Weekday.Sunday
+        return bool(_WEEKEND_MASK >> w.value & 1)
 
     def is_end_of_month(self, date: datetime) -> bool:
-        return date.month != self.adjust(date=date + timedelta(days=1)).month
+        # whether the next business day falls in the following month
+        last_day = _month_length(date.year, date.month)
+        if date.day == last_day:
+            return True
+        next_day = date.toordinal() + 1
+        if self._is_business_ordinal(next_day, date.year):
+            return False
+        next_month = next_day + last_day - date.day
+        return self._nth_business_day(next_day, date.year, 1) >= next_month
 
     def end_of_month(self, date: datetime) -> datetime:
         this_month_end = DateTool.end_of_month(date=date)
         return self.adjust(date=this_month_end, convention=BusinessDayConvention.Preceding)
 
+    def _build_year_holiday_mask(self, year: int) -> np.ndarray:
+        is_business_day = self._is_business_day
+        return np.array([not is_business_day(datetime.fromordinal(ordinal))
+                         for ordinal in range(_year_start(year), _year_start(year + 1))])
+
+    def _build_weekend_and_holiday_mask(self, year: int) -> np.ndarray:
+        """
+        :param year:
+        :return: _build_year_holiday_mask for calendars closed on Saturdays, Sundays
+                 and the days returned by _build_year
+        """
+        first = _year_start(year)
+        ordinals = np.arange(first, _year_start(year + 1))
+        mask = _weekday(ordinals) >= _SAT
+        mask[[ordinal - first for ordinal in self._year_holidays(year)]] = True
+        return mask
+
+    def _year_holiday_mask(self, year: int) -> np.ndarray:
+        """
+        :param year:
+        :return: boolean array flagging the intrinsic holidays of each day of the year
+        """
+        if not self._fixed_rules:
+            return self._build_year_holiday_mask(year)
+        key = (self.calendar_type, year)
+        mask = self._holiday_mask_cache.get(key)
+        if mask is None:
+            mask = self._build_year_holiday_mask(year)
+            self._holiday_mask_cache[key] = mask
+        return mask
+
+    def _holiday_mask(self, begin: datetime, end: datetime) -> np.ndarray:
+        """
+        :return: boolean array flagging the holidays between begin and end, both included
+        """
+        first = np.datetime64(begin, 'D')
+        start = int((first - first.astype('datetime64[Y]')).astype(int))
+        n = int((np.datetime64(end, 'D') - first).astype(int)) + 1
+        masks = [self._year_holiday_mask(year) for year in range(begin.year, end.year + 1)]
+        mask = np.concatenate(masks)[start:start + n]
+        # apply the user-defined changes
+        begin_ordinal = begin.toordinal()
+        for ordinal in self.added_holidays:
+            i = ordinal - begin_ordinal
+            if 0 <= i < n:
+                mask[i] = True
+        for ordinal in self.removed_holidays:
+            i = ordinal - begin_ordinal
+            if 0 <= i < n:
+                mask[i] = False
+        return mask
+
+    def _holiday_ordinals(self, year: int) -> frozenset:
+        """
+        :param year:
+        :return: ordinals of the days of the year that are not business days,
+                 weekends and user-defined changes included
+        """
+        mask = self._holiday_mask(datetime(year, 1, 1), datetime(year, 12, 31))
+        return frozenset((np.flatnonzero(mask) + _year_start(year)).tolist())
+
+    def _year_business_day_counts(self, year: int) -> np.ndarray:
+        """
+        :param year:
+        :return: array whose i-th element counts the business days from January 1st
+                 to the i-th day of the year, both included
+        """
+        key = (self.calendar_type, year) if self._fixed_rules else None
+        counts = self._business_day_count_cache.get(key)
+        if counts is None:
+            counts = np.cumsum(~self._holiday_mask(datetime(year, 1, 1), datetime(year, 12, 31)))
+            if key is not None:
+                self._business_day_count_cache[key] = counts
+        return counts
+
+    def _nth_business_day(self, ordinal: int, year: int, n: int) -> int:
+        """
+        :param ordinal: day ordinal, as returned by date.toordinal()
+        :param year: year of that day
+        :param n: non-zero number of business days, negative to go backwards
+        :return: ordinal of the n-th business day after (or before) the given day
+        """
+        counts = self._year_business_day_counts(year)
+        i = ordinal - _year_start(year)
+        # rank of the wanted business day within the current year
+        if n > 0:
+            rank = int(counts[i]) + n
+        else:
+            rank = (int(counts[i - 1]) if i > 0 else 0) + n + 1
+        while rank > counts[-1]:
+            rank -= int(counts[-1])
+            year += 1
+            counts = self._year_business_day_counts(year)
+        while rank <= 0:
+            year -= 1
+            counts = self._year_business_day_counts(year)
+            rank += int(counts[-1])
+        return _year_start(year) + int(np.searchsorted(counts, rank))
+
+    def _business_days_in(self, first: datetime, last: datetime) -> int:
+        """
+        :return: number of business days from first to last, both included
+        """
+        i = first.toordinal() - _year_start(first.year)
+        num = -int(self._year_business_day_counts(first.year)[i - 1]) if i > 0 else 0
+        for year in range(first.year, last.year):
+            num += int(self._year_business_day_counts(year)[-1])
+        j = last.toordinal() - _year_start(last.year)
+        return num + int(self._year_business_day_counts(last.year)[j])
+
+    def _weekend_mask(self, begin: datetime, end: datetime) -> np.ndarray:
+        """
+        :return: boolean array flagging the weekend days between begin and end, both included
+        """
+        days = np.arange(np.datetime64(begin, 'D'), np.datetime64(end, 'D') + 1)
+        # 1970-01-01 was a Thursday, so this counts from Monday = 0
+        weekdays = (days.view('i8') + _THU) % 7
+        weekend = np.array([self.is_weekend(Weekday(i + 1)) for i in range(7)])
+        return weekend[weekdays]
+
+    def is_business_days(self, begin: datetime, end: datetime) -> np.ndarray:
+        """
+        :param begin:
+        :param end:
+        :return: boolean array flagging the business days between begin and end, both included
+        """
+        qt_require(end >= begin, f"'begin' date ({begin}) must be equal to or earlier than 'end' date ({end})")
+        return ~self._holiday_mask(begin, end)
+
+    def is_business_day_array(self, dates: np.ndarray) -> np.ndarray:
+        """
+        :param dates: array of dates, converted to datetime64[D]
+        :return: boolean array flagging which of the given dates are business days
+        """
+        days = np.asarray(dates, dtype='datetime64[D]')
+        year_starts = days.astype('datetime64[Y]')
+        years = year_starts.astype(int) + 1970
+        day_in_year = (days - year_starts).astype(int)
+        business_days = np.empty(days.shape, dtype=bool)
+        for year in np.unique(years).tolist():
+            in_year = years == year
+            business_days[in_year] = ~self._year_holiday_mask(year)[day_in_year[in_year]]
+        # apply the user-defined changes, added holidays taking precedence
+        if self.added_holidays or self.removed_holidays:
+            ordinals = days.astype(np.int64) + _year_start(1970)
+            business_days[np.isin(ordinals, list(self.removed_holidays))] = True
+            business_days[np.isin(ordinals, list(self.added_holidays))] = False
+        return business_days
+
     def holiday_list(self,
                      begin: datetime,
                      end: datetime,
                      include_weekends: bool = False):
         qt_require(end >= begin, f"'begin' date ({begin}) must be equal to or earlier than 'end' date ({end})")
-        result = []
-        date = begin
-        one_day = timedelta(days=1)
-        while date <= end:
-            w = DateTool.weekday(date=date)
-            if self.is_holiday(date=date) and (include_weekends or not self.is_weekend(w=w)):
-                result.append(date)
-            date += one_day
-        return result
+        holidays = self._holiday_mask(begin, end)
+        if not include_weekends:
+            holidays &= ~self._weekend_mask(begin, end)
+        return [begin + timedelta(days=int(i)) for i in np.flatnonzero(holidays)]
 
     def business_day_list(self,
                           begin: datetime,
                           end: datetime):
         qt_require(end >= begin, f"'begin' date ({begin}) must be equal to or earlier than 'end' date ({end})")
-        result = []
-        date = begin
-        one_day = timedelta(days=1)
-        while date <= end:
-            if self.is_business_day(date=date):
-                result.append(date)
-            date += one_day
-        return result
+        business_days = self.is_business_days(begin, end)
+        return [begin + timedelta(days=int(i)) for i in np.flatnonzero(business_days)]
 
     def adjust(self,
                date: datetime,
                convention: BusinessDayConvention = BusinessDayConvention.Following):
         if convention == BusinessDayConvention.Unadjusted:
             return date
-        date1 = date
-        one_day = timedelta(days=1)
         if convention == BusinessDayConvention.Following or \
                 convention == BusinessDayConvention.Modified_Following or \
                 convention == BusinessDayConvention.Half_Month_Modified_Following:
-            while self.is_holiday(date1):
-                date1 += one_day
+            date1 = self._nearest_business_day(date, 1)
             if convention == BusinessDayConvention.Modified_Following or \
                     convention == BusinessDayConvention.Half_Month_Modified_Following:
                 if date1.month != date.month:
@@ -203,24 +441,31 @@ class Calendar(metaclass=ABCMeta):
                         return self.adjust(date=date, convention=BusinessDayConvention.Preceding)
         elif convention == BusinessDayConvention.Preceding or \
                 convention == BusinessDayConvention.Modified_Preceding:
-            while self.is_holiday(date1):
-                date1 -= one_day
+            date1 = self._nearest_business_day(date, -1)
             if convention == BusinessDayConvention.Modified_Preceding and \
                     date1.month != date.month:
                 return self.adjust(date=date, convention=BusinessDayConvention.Following)
         elif convention == BusinessDayConvention.Nearest:
-            date2 = date
-            while self.is_holiday(date1) and self.is_holiday(date2):
-                date1 += one_day
-                date2 -= one_day
-            if self.is_holiday(date1):
+            date1 = self._nearest_business_day(date, 1)
+            date2 = self._nearest_business_day(date, -1)
+            # ties go to the following business day
+            if date1 - date > date - date2:
                 return date2
-            else:
-                return date1
         else:
             raise QTError("unknown business-day convention.")
         return date1
 
+    def _nearest_business_day(self, date: datetime, n: int) -> datetime:
+        """
+        :param date:
+        :param n: 1 to look forwards, -1 to look backwards
+        :return: the given date if it is a business day, the first business day after
+                 (or before) it otherwise
+        """
+        if self.is_business_day(date):
+            return date
+        return date + timedelta(days=self._nth_business_day(date.toordinal(), date.year, n) - date.toordinal())
+
     def advance(self,
                 date: datetime,
                 n: int = None,
@@ -238,21 +483,7 @@ class Calendar(metaclass=ABCMeta):
             if n == 0:
                 return self.adjust(date=date, convention=convention)
             elif unit == TimeUnit.Days:
-                date1 = date
-                one_day = timedelta(days=1)
-                if n > 0:
-                    while n > 0:
-                        date1 += one_day
-                        while self.is_holiday(date1):
-                            date1 += one_day
-                        n -= 1
-                else:
-                    while n < 0:
-                        date1 -= one_day
-                        while self.is_holiday(date1):
-                            date1 -= one_day
-                        n += 1
-                return date1
+                return date + timedelta(days=self._nth_business_day(date.toordinal(), date.year, n) - date.toordinal())
             elif unit == TimeUnit.Weeks:
                 date1 = DateTool.advance(date=date, n=n, units=unit)
                 return self.adjust(date=date1, convention=convention)
@@ -275,41 +506,19 @@ class Calendar(metaclass=ABCMeta):
                               end: datetime,
                               include_begin: bool = True,
                               include_end: bool = False):
-        num = 0
-        one_day = timedelta(days=1)
-        if begin != end:
-            if begin < end:
-                # the last one is treated separately to avoid
-                # incrementing max_date()
-                date = begin
-                while date < end:
-                    if self.is_business_day(date=date):
-                        num += 1
-                    date += one_day
-                if self.is_business_day(date=end):
-                    num += 1
-            elif begin > end:
-                date = end
-                while date < begin:
-                    if self.is_business_day(date=date):
-                        num += 1
-                    date += one_day
-                if self.is_business_day(date=begin):
-                    num += 1
-
-            if self.is_business_day(begin) and not include_begin:
-                num -= 1
-            if self.is_business_day(end) and not include_end:
-                num -= 1
-
-            if begin > end:
-                num = -num
-        elif include_begin and include_end and self.is_business_day(date=begin):
-            num = 1
-
-        return num
+        if begin.toordinal() == end.toordinal():
+            return 1 if include_begin and include_end and self.is_business_day(begin) else 0
+
+        first, last = (begin, end) if begin < end else (end, begin)
+        num = self._business_days_in(first, last)
+        if self.is_business_day(begin) and not include_begin:
+            num -= 1
+        if self.is_business_day(end) and not include_end:
+            num -= 1
+        return -num if begin > end else num
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def easter_monday(year: int, easter_monday_type: EasterMondayTypes):
         """
         :return: datetime
@@ -338,7 +547,10 @@ class Calendar(metaclass=ABCMeta):
         :param other: Calendar
         :return: bool
         """
-        return self.name() == other.name()
+        return isinstance(other, Calendar) and self._name == other._name
+
+    def __hash__(self):
+        return hash(self._name)
 
     def __ne__(self, other):
         """
@@ -14,6 +14,9 @@ class BespokeCalendar(Calendar):
     one; adding a new holiday or weekday will affect all linked
     instances.
     """
+    __slots__ = ('_weekend', 'added_holidays', 'removed_holidays')
+    # weekend days can be added at any time
+    _fixed_rules = False
 
     def __init__(self, name: str = ""):
         self._name = name
@@ -21,9 +24,6 @@ class BespokeCalendar(Calendar):
         self.added_holidays = set()
         self.removed_holidays = set()
 
-    def name(self) -> str:
-        return self._name
-
     def is_weekend(self, w: Weekday) -> bool:
         return w in self._weekend
 
@@ -32,3 +32,4 @@ class BespokeCalendar(Calendar):
 
     def add_weekend(self, w: Weekday):
         self._weekend.add(w)
+        Calendar._changes += 1
@@ -1,9 +1,10 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime
+
+import numpy as np
 
 from qtmodel.error import QTError
-from qtmodel.time.calendar import Calendar, CalendarTypes, EasterMondayTypes
-from qtmodel.time.date import DateTool
-from qtmodel.time.weekday import Weekday
+from qtmodel.time.calendar import Calendar, CalendarTypes, _SAT, _SUN, _weekday, \
+    _western_easter_monday_ordinals
 
 brazil_calendar_types = [
     CalendarTypes.BRAZIL_SETTLEMENT,
@@ -11,6 +12,68 @@ brazil_calendar_types = [
 ]
 
 
+def _settlement_holidays(year: int, easter_monday: int):
+    """
+    :param year:
+    :param easter_monday: ordinal of the Western Easter Monday
+    :return: ordinals of the banking holidays
+    """
+    return [
+        # New Year's Day
+        date(year, 1, 1).toordinal(),
+        # Tiradentes Day
+        date(year, 4, 21).toordinal(),
+        # Labor Day
+        date(year, 5, 1).toordinal(),
+        # Independence Day
+        date(year, 9, 7).toordinal(),
+        # Nossa Sra. Aparecida Day
+        date(year, 10, 12).toordinal(),
+        # All Souls Day
+        date(year, 11, 2).toordinal(),
+        # Republic Day
+        date(year, 11, 15).toordinal(),
+        # Christmas
+        date(year, 12, 25).toordinal(),
+        # Passion of Christ
+        easter_monday - 3,
+        # Carnival
+        easter_monday - 49,
+        easter_monday - 48,
+        # Corpus Christi
+        easter_monday + 59
+    ]
+
+
+def _exchange_holidays(year: int, easter_monday: int):
+    """
+    :param year:
+    :param easter_monday: ordinal of the Western Easter Monday
+    :return: ordinals of the Bovespa holidays
+    """
+    holidays = _settlement_holidays(year, easter_monday)
+    holidays += [
+        # Sao Paulo City Day
+        date(year, 1, 25).toordinal(),
+        # Revolution Day
+        date(year, 7, 9).toordinal()
+    ]
+    # Black Consciousness Day
+    if year >= 2007:
+        holidays.append(date(year, 11, 20).toordinal())
+    # Christmas Eve
+    holidays.append(date(year, 12, 24).toordinal())
+    # last business day of the year: December 31st or, when it falls
+    # on a weekend, the Friday before it
+    december_31st = date(year, 12, 31).toordinal()
+    holidays.append(december_31st)
+    if _weekday(december_31st) == _SAT:
+        holidays.append(december_31st - 1)
+    elif _weekday(december_31st) == _SUN:
+        holidays.append(december_31st - 2)
+    return holidays
+
+
 class Brazil(Calendar):
     """
     Brazilian calendar
@@ -49,6 +112,7 @@ class Brazil(Calendar):
     Corpus Christi
     the last business day of the year
     """
+    __slots__ = ('_market_holidays',)
     added_holidays = set()
     removed_holidays = set()
 
@@ -57,87 +121,20 @@ class Brazil(Calendar):
             raise QTError("unknown market")
         else:
             super().__init__(calendar_type=calendar_type)
+        # holiday rules of the chosen market
+        if calendar_type == CalendarTypes.BRAZIL_SETTLEMENT:
+            self._market_holidays = _settlement_holidays
+        else:
+            self._market_holidays = _exchange_holidays
 
     def _is_business_day(self, date: datetime) -> bool:
-        if self.calendar_type == CalendarTypes.BRAZIL_SETTLEMENT:
-            return self._is_business_day_settlement(date=date)
-        elif self.calendar_type == CalendarTypes.BRAZIL_EXCHANGE:
-            return self._is_business_day_exchange(date=date)
-
-    def _is_business_day_settlement(self, date: datetime) -> bool:
-        year = date.year
-        month = date.month
-        weekday = DateTool.weekday(date=date)
-        day = date.day
-        easter_monday = self.easter_monday(year=year,
-                                           easter_monday_type=EasterMondayTypes.Western)
-
-        if (self.is_weekend(weekday)
-                # New Year's Day
-                or (day == 1 and month == 1)
-                # Tiradentes Day
-                or (day == 21 and month == 4)
-                # Labor Day
-                or (day == 1 and month == 5)
-                # Independence Day
-                or (day == 7 and month == 9)
-                # Nossa Sra. Aparecida Day
-                or (day == 12 and month == 10)
-                # All Souls Day
-                or (day == 2 and month == 11)
-                # Republic Day
-                or (day == 15 and month == 11)
-                # Christmas
-                or (day == 25 and month == 12)
-                # Passion of Christ
-                or (date == easter_monday - timedelta(days=3))
-                # Carnival
-                or (date == easter_monday - timedelta(days=49) or date == easter_monday - timedelta(days=48))
-                # Corpus Christi
-                or (date == easter_monday + timedelta(days=59))):
-            return False  # NOLINT(readability-simplify-boolean-expr)
-        return True
+        if date.weekday() >= _SAT:
+            return False
+        return date.toordinal() not in self._year_holidays(date.year)
 
-    def _is_business_day_exchange(self, date: datetime) -> bool:
-        year = date.year
-        month = date.month
-        weekday = DateTool.weekday(date=date)
-        day = date.day
-        easter_monday = self.easter_monday(year=year,
-                                           easter_monday_type=EasterMondayTypes.Western)
+    def _build_year_holiday_mask(self, year: int) -> np.ndarray:
+        return self._build_weekend_and_holiday_mask(year)
 
-        if (self.is_weekend(weekday)
-                # New Year's Day
-                or (day == 1 and month == 1)
-                # Sao Paulo City Day
-                or (day == 25 and month == 1)
-                # Tiradentes Day
-                or (day == 21 and month == 4)
-                # Labor Day
-                or (day == 1 and month == 5)
-                # Revolution Day
-                or (day == 9 and month == 7)
-                # Independence Day
-                or (day == 7 and month == 9)
-                # Nossa Sra. Aparecida Day
-                or (day == 12 and month == 10)
-                # All Souls Day
-                or (day == 2 and month == 11)
-                # Republic Day
-                or (day == 15 and month == 11)
-                # Black Consciousness Day
-                or (day == 20 and month == 11 and year >= 2007)
-                # Christmas Eve
-                or (day == 24 and month == 12)
-                # Christmas
-                or (day == 25 and month == 12)
-                # Passion of Christ
-                or (date == easter_monday - timedelta(days=3))
-                # Carnival
-                or (date == easter_monday - timedelta(days=49) or date == easter_monday - timedelta(days=48))
-                # Corpus Christi
-                or (date == easter_monday + timedelta(days=59))
-                # last business day of the year
-                or (month == 12 and (day == 31 or (day >= 29 and weekday == Weekday.Friday)))):
-            return False  # NOLINT(readability-simplify-boolean-expr)
-        return True
+    def _build_year(self, year: int):
+        easter_monday = _western_easter_monday_ordinals[year - 1901]
+        return self._market_holidays(year, easter_monday)
@@ -1,12 +1,38 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime
+
+import numpy as np
 
 from qtmodel.error import QTError
-from qtmodel.time.calendar import Calendar, CalendarTypes, EasterMondayTypes
-from qtmodel.time.date import DateTool
-from qtmodel.time.weekday import Weekday
+from qtmodel.time.calendar import Calendar, CalendarTypes, _MON, _TUE, _SAT, _weekday, \
+    _monday_on_or_after, _western_easter_monday_ordinals
 
 canada_calendar_types = [CalendarTypes.CANADA_SETTLEMENT, CalendarTypes.CANADA_TSX]
 
+# holidays observed by some of the Canadian markets only
+_TRUTH_AND_RECONCILIATION = 1
+_REMEMBRANCE_DAY = 2
+_canada_rules = {
+    CalendarTypes.CANADA_SETTLEMENT: _TRUTH_AND_RECONCILIATION | _REMEMBRANCE_DAY,
+    CalendarTypes.CANADA_TSX: 0
+}
+
+
+def _monday_on_or_before(ordinal: int) -> int:
+    return ordinal - (_weekday(ordinal) - _MON) % 7
+
+
+def _moved_to_monday(ordinal: int):
+    """
+    :param ordinal:
+    :return: the holiday itself, plus the Monday after it if it falls on a weekend
+    """
+    holidays = [ordinal]
+    for observed in (ordinal + 1, ordinal + 2):
+        if _weekday(observed) == _MON:
+            holidays.append(observed)
+    return holidays
+
+
 class Canada(Calendar):
     """
     Canadian calendar
@@ -42,6 +68,7 @@ class Canada(Calendar):
     Christmas, December 25th (possibly moved to Monday or Tuesday)
     Boxing Day, December 26th (possibly moved to Monday or Tuesday)
     """
+    __slots__ = ('_rules',)
 
     added_holidays = set()
     removed_holidays = set()
@@ -51,78 +78,49 @@ class Canada(Calendar):
             raise QTError("unknown market")
         else:
             super().__init__(calendar_type=calendar_type)
+        self._rules = _canada_rules[calendar_type]
 
     def _is_business_day(self, date: datetime) -> bool:
-        if self.calendar_type == CalendarTypes.CANADA_SETTLEMENT:
-            year = date.year
-            month = date.month
-            weekday = DateTool.weekday(date=date)
-            day = date.day
-            easter_monday = self.easter_monday(year=year, easter_monday_type=EasterMondayTypes.Western)
-            if (self.is_weekend(weekday)
-                    # New Year's Day (possibly moved to Monday)
-                    or ((day == 1 or ((day == 2 or day == 3) and weekday == Weekday.Monday)) and month == 1)
-                    # Family Day (third Monday in February, since 2008)
-                    or ((15 <= day <= 21) and weekday == Weekday.Monday and month == 2
-                        and year >= 2008)
-                    # Good Friday
-                    or (date == easter_monday - timedelta(days=3))
-                    # The Monday on or preceding 24 May (Victoria Day)
-                    or (17 < day <= 24 and weekday == Weekday.Monday and month == 5)
-                    # July 1st, possibly moved to Monday (Canada Day)
-                    or ((day == 1 or ((day == 2 or day == 3) and weekday == Weekday.Monday)) and month == 7)
-                    # first Monday of August (Provincial Holiday)
-                    or (day <= 7 and weekday == Weekday.Monday and month == 8)
-                    # first Monday of September (Labor Day)
-                    or (day <= 7 and weekday == Weekday.Monday and month == 9)
-                    # September 30th, possibly moved to Monday
-                    # (National Day for Truth and Reconciliation, since 2021)
-                    or (((day == 30 and month == 9) or (
-                            day <= 2 and month == 10 and weekday == Weekday.Monday)) and year >= 2021)
-                    # second Monday of October (Thanksgiving Day)
-                    or (7 < day <= 14 and weekday == Weekday.Monday and month == 10)
-                    # November 11th (possibly moved to Monday)
-                    or ((day == 11 or ((day == 12 or day == 13) and weekday == Weekday.Monday))
-                        and month == 11)
-                    # Christmas (possibly moved to Monday or Tuesday)
-                    or ((day == 25 or (day == 27 and (weekday == Weekday.Monday or weekday == Weekday.Tuesday)))
-                        and month == 12)
-                    # Boxing Day (possibly moved to Monday or Tuesday)
-                    or ((day == 26 or (day == 28 and (weekday == Weekday.Monday or weekday == Weekday.Tuesday)))
-                        and month == 12)):
-                return False  # NOLINT(readability-simplify-boolean-expr)
-            return True
-
-        elif self.calendar_type == CalendarTypes.CANADA_TSX:
-            year = date.year
-            month = date.month
-            weekday = DateTool.weekday(date=date)
-            day = date.day
-            easter_monday = self.easter_monday(year=year, easter_monday_type=EasterMondayTypes.Western)
-            if (self.is_weekend(weekday)
-                    # New Year's Day (possibly moved to Monday)
-                    or ((day == 1 or ((day == 2 or day == 3) and weekday == Weekday.Monday)) and month == 1)
-                    # Family Day (third Monday in February, since 2008)
-                    or ((15 <= day <= 21) and weekday == Weekday.Monday and month == 2
-                        and year >= 2008)
-                    # Good Friday
-                    or (date == easter_monday - timedelta(days=3))
-                    # The Monday on or preceding 24 May (Victoria Day)
-                    or (17 < day <= 24 and weekday == Weekday.Monday and month == 5)
-                    # July 1st, possibly moved to Monday (Canada Day)
-                    or ((day == 1 or ((day == 2 or day == 3) and weekday == Weekday.Monday)) and month == 7)
-                    # first Monday of August (Provincial Holiday)
-                    or (day <= 7 and weekday == Weekday.Monday and month == 8)
-                    # first Monday of September (Labor Day)
-                    or (day <= 7 and weekday == Weekday.Monday and month == 9)
-                    # second Monday of October (Thanksgiving Day)
-                    or (7 < day <= 14 and weekday == Weekday.Monday and month == 10)
-                    # Christmas (possibly moved to Monday or Tuesday)
-                    or ((day == 25 or (day == 27 and (weekday == Weekday.Monday or weekday == Weekday.Tuesday)))
-                        and month == 12)
-                    # Boxing Day (possibly moved to Monday or Tuesday)
-                    or ((day == 26 or (day == 28 and (weekday == Weekday.Monday or weekday == Weekday.Tuesday)))
-                        and month == 12)):
-                return False  # NOLINT(readability-simplify-boolean-expr)
-            return True
+        if date.weekday() >= _SAT:
+            return False
+        return date.toordinal() not in self._year_holidays(date.year)
+
+    def _build_year_holiday_mask(self, year: int) -> np.ndarray:
+        return self._build_weekend_and_holiday_mask(year)
 
+    def _build_year(self, year: int):
+        easter_monday = _western_easter_monday_ordinals[year - 1901]
+        holidays = [
+            # Good Friday
+            easter_monday - 3,
+            # The Monday on or preceding 24 May (Victoria Day)
+            _monday_on_or_before(date(year, 5, 24).toordinal()),
+            # first Monday of August (Provincial Holiday)
+            _monday_on_or_after(date(year, 8, 1).toordinal()),
+            # first Monday of September (Labor Day)
+            _monday_on_or_after(date(year, 9, 1).toordinal()),
+            # second Monday of October (Thanksgiving Day)
+            _monday_on_or_after(date(year, 10, 8).toordinal())
+        ]
+        # New Year's Day (possibly moved to Monday)
+        holidays += _moved_to_monday(date(year, 1, 1).toordinal())
+        # Family Day (third Monday in February, since 2008)
+        if year >= 2008:
+            holidays.append(_monday_on_or_after(date(year, 2, 15).toordinal()))
+        # July 1st, possibly moved to Monday (Canada Day)
+        holidays += _moved_to_monday(date(year, 7, 1).toordinal())
+        rules = self._rules
+        # September 30th, possibly moved to Monday
+        # (National Day for Truth and Reconciliation, since 2021)
+        if rules & _TRUTH_AND_RECONCILIATION and year >= 2021:
+            holidays += _moved_to_monday(date(year, 9, 30).toordinal())
+        # November 11th (possibly moved to Monday)
+        if rules & _REMEMBRANCE_DAY:
+            holidays += _moved_to_monday(date(year, 11, 11).toordinal())
+        # Christmas and Boxing Day (possibly moved to Monday or Tuesday)
+        christmas = date(year, 12, 25).toordinal()
+        holidays += [christmas, christmas + 1]
+        for ordinal in (christmas + 2, christmas + 3):
+            if _weekday(ordinal) in (_MON, _TUE):
+                holidays.append(ordinal)
+        return holidays
@@ -1,12 +1,10 @@
-from datetime import datetime
-
-import pandas as pd
+from datetime import date, datetime
 
 from qtmodel.error import QTError
-from qtmodel.time.calendar import Calendar, CalendarTypes
-from qtmodel.time.date import DateTool
+from qtmodel.time.calendar import Calendar, CalendarTypes, _SAT
 
-precomputed_china_holidays = set(pd.to_datetime(
+# pre-calculated dates, kept as day ordinals
+precomputed_china_holidays = frozenset(date.fromisoformat(day).toordinal() for day in (
     [
         "1991-01-01",
         "1991-02-15",
@@ -579,7 +577,7 @@ precomputed_china_holidays = set(pd.to_datetime(
     ]
 ))
 
-precomputed_china_adjusted_workdays = set(pd.to_datetime(
+precomputed_china_adjusted_workdays = frozenset(date.fromisoformat(day).toordinal() for day in (
     [
         "2005-02-05",
         "2005-02-06",
@@ -705,24 +703,29 @@ china_calendar_types = [CalendarTypes.CHINA_SSE, CalendarTypes.CHINA_IB]
 
 
 class China(Calendar):
+    # the market's predicate, bound per instance in place of a dispatching method
+    __slots__ = ('_is_business_day',)
     added_holidays = set()
     removed_holidays = set()
+
     def __init__(self, calendar_type: CalendarTypes):
         if calendar_type not in china_calendar_types:
             raise QTError("unknown market")
         else:
             super().__init__(calendar_type=calendar_type)
+        # bind the market's predicate once, instead of dispatching on every call
+        if calendar_type == CalendarTypes.CHINA_SSE:
+            self._is_business_day = self._is_business_day_sse
+        else:
+            self._is_business_day = self._is_business_day_ib
 
-    def _is_business_day(self, date: datetime) -> bool:
+    def _is_business_day_ib(self, date: datetime) -> bool:
         """
+        Check whether date is a business day in the inter bank market calendar.
         :param date:
         :return:
         """
-        is_business_day_sse = self._is_business_day_sse(date=date)
-        if self.calendar_type == CalendarTypes.CHINA_SSE:
-            return is_business_day_sse
-        elif self.calendar_type == CalendarTypes.CHINA_IB:
-            return is_business_day_sse or date in precomputed_china_adjusted_workdays
+        return self._is_business_day_sse(date) or date.toordinal() in precomputed_china_adjusted_workdays
 
     def _is_business_day_sse(self, date: datetime) -> bool:
         """
@@ -730,7 +733,6 @@ class China(Calendar):
         :param date:
         :return:
         """
-        weekday = DateTool.weekday(date=date)
-        if self.is_weekend(w=weekday) or date in precomputed_china_holidays:
+        if date.weekday() >= _SAT:
             return False
-        return True
+        return date.toordinal() not in precomputed_china_holidays
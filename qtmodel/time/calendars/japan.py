@@ -1,8 +1,57 @@
-from datetime import datetime
+from datetime import date, datetime
 
-from qtmodel.time.calendar import Calendar, CalendarTypes
-from qtmodel.time.date import DateTool
-from qtmodel.time.weekday import Weekday
+import numpy as np
+
+from qtmodel.time.calendar import Calendar, CalendarTypes, _MON, _TUE, _WED, _SAT, _SUN, _weekday, \
+    _monday_on_or_after
+
+
+def _equinoxes(year: int):
+    """
+    :param year:
+    :return: days of March and September of the vernal and autumnal equinoxes
+    """
+    exact_vernal_equinox_time = 20.69115
+    exact_autumnal_equinox_time = 23.09
+    diff_per_year = 0.242194
+    moving_amount = (year - 2000) * diff_per_year
+    number_of_leap_years = (year - 2000) // 4 + \
+        (year - 2000) // 100 - (year - 2000) // 400
+    ve = int(exact_vernal_equinox_time
+             + moving_amount - number_of_leap_years)  # vernal equinox day
+    ae = int(exact_autumnal_equinox_time + moving_amount -
+             number_of_leap_years)  # autumnal equinox day
+    return ve, ae
+
+
+# equinox days over the years calendars are usually asked about
+_EQUINOXES = {year: _equinoxes(year) for year in range(1900, 2100)}
+
+
+def _observed(ordinal: int):
+    """
+    :param ordinal:
+    :return: the holiday itself, plus the Monday after it if it falls on a Sunday
+    """
+    if _weekday(ordinal) == _SUN:
+        return [ordinal, ordinal + 1]
+    return [ordinal]
+
+
+# one-shot holidays, as (month, day) per year
+_ONE_SHOT_HOLIDAYS = {
+    # Marriage of Prince Akihito
+    1959: [(4, 10)],
+    # Rites of Imperial Funeral
+    1989: [(2, 24)],
+    # Enthronement Ceremony (Emperor Akihito)
+    1990: [(11, 12)],
+    # Marriage of Prince Naruhito
+    1993: [(6, 9)],
+    # Special holidays based on Japanese public holidays law,
+    # Enthronement Day and Enthronement Ceremony (Emperor Naruhito)
+    2019: [(4, 30), (5, 1), (5, 2), (10, 22)]
+}
 
 
 class Japan(Calendar):
@@ -34,6 +83,7 @@ class Japan(Calendar):
     Holidays falling on a Sunday are observed on the Monday following
     except for the bank holidays associated with the new year.
     """
+    __slots__ = ()
     added_holidays = set()
     removed_holidays = set()
 
@@ -41,121 +91,106 @@ class Japan(Calendar):
         super().__init__(calendar_type=CalendarTypes.JAPAN)
 
     def _is_business_day(self, date: datetime) -> bool:
-        """
-        :param date:
-        :return:
-        """
-        year = date.year
-        month = date.month
-        weekday = DateTool.weekday(date=date)
-        day = date.day
-        # equinox calculation
-        exact_vernal_equinox_time = 20.69115
-        exact_autumnal_equinox_time = 23.09
-        diff_per_year = 0.242194
-        moving_amount = (year - 2000) * diff_per_year
-        number_of_leap_years = (year - 2000) / 4 + \
-            (year - 2000) / 100 - (year - 2000) / 400
-        ve = int(exact_vernal_equinox_time
-                 + moving_amount - number_of_leap_years)  # vernal equinox day
-        ae = int(exact_autumnal_equinox_time + moving_amount -
-                 number_of_leap_years)  # autumnal equinox day
-        # checks
-        if (self.is_weekend(weekday)
+        if date.weekday() >= _SAT:
+            return False
+        return date.toordinal() not in self._year_holidays(date.year)
+
+    def _build_year_holiday_mask(self, year: int) -> np.ndarray:
+        return self._build_weekend_and_holiday_mask(year)
+
+    def _build_year(self, year: int):
+        # the year-dependent rules are resolved once, and the holidays
+        # computed directly instead of testing every day of the year
+        ve, ae = _EQUINOXES.get(year) or _equinoxes(year)
+        new_year = date(year, 1, 1).toordinal()
+        holidays = [
             # New Year's Day
-            or (day == 1 and month == 1)
-            # Bank Holiday
-            or (day == 2 and month == 1)
-            # Bank Holiday
-            or (day == 3 and month == 1)
-            # Coming of Age Day (2nd Monday in January),
-            # was January 15th until 2000
-            or (weekday == Weekday.Monday and (8 <= day <= 14) and month == 1
-                and year >= 2000)
-            or ((day == 15 or (day == 16 and weekday == Weekday.Monday)) and month == 1
-                and year < 2000)
-            # National Foundation Day
-            or ((day == 11 or (day == 12 and weekday == Weekday.Monday)) and month == 2)
-            # Emperor's Birthday (Emperor Naruhito)
-            or ((day == 23 or (day == 24 and weekday == Weekday.Monday)) and month == 2
-                and year >= 2020)
-            # Emperor's Birthday (Emperor Akihito)
-            or ((day == 23 or (day == 24 and weekday == Weekday.Monday)) and month == 12
-                and (1989 <= year < 2019))
-            # Vernal Equinox
-            or ((day == ve or (day == ve + 1 and weekday == Weekday.Monday)) and month == 3)
-            # Greenery Day
-            or ((day == 29 or (day == 30 and weekday == Weekday.Monday)) and month == 4)
+            new_year,
+            # Bank Holidays
+            new_year + 1,
+            new_year + 2,
             # Constitution Memorial Day
-            or (day == 3 and month == 5)
+            date(year, 5, 3).toordinal(),
             # Holiday for a Nation
-            or (day == 4 and month == 5)
+            date(year, 5, 4).toordinal(),
             # Children's Day
-            or (day == 5 and month == 5)
-            # any of the three above observed later if on Saturday or Sunday
-            or (day == 6 and month == 5
-                and (weekday == Weekday.Monday or weekday == Weekday.Tuesday or weekday == Weekday.Wednesday))
-            # Marine Day (3rd Monday in July),
-            # was July 20th until 2003, not a holiday before 1996,
-            # July 23rd in 2020 due to Olympics games
-            # July 22nd in 2021 due to Olympics games
-            or (weekday == Weekday.Monday and (15 <= day <= 21) and month == 7
-                and ((2003 <= year < 2020) or year >= 2022))
-            or ((day == 20 or (day == 21 and weekday == Weekday.Monday)) and month == 7
-                and 1996 <= year < 2003)
-            or (day == 23 and month == 7 and year == 2020)
-            or (day == 22 and month == 7 and year == 2021)
-            # Mountain Day
-            # (moved in 2020 due to Olympics games)
-            # (moved in 2021 due to Olympics games)
-            or ((day == 11 or (day == 12 and weekday == Weekday.Monday)) and month == 8
-                and ((2016 <= year < 2020) or year >= 2022))
-            or (day == 10 and month == 8 and year == 2020)
-            or (day == 9 and month == 8 and year == 2021)
-            # Respect for the Aged Day (3rd Monday in September),
-            # was September 15th until 2003
-            or (weekday == Weekday.Monday and (15 <= day <= 21) and month == 9
-                and year >= 2003)
-            or ((day == 15 or (day == 16 and weekday == Weekday.Monday)) and month == 9
-                and year < 2003)
+            date(year, 5, 5).toordinal(),
+            # Bank Holiday
+            date(year, 12, 31).toordinal()
+        ]
+        # any of the three above observed later if on Saturday or Sunday
+        may_6 = date(year, 5, 6).toordinal()
+        if _weekday(may_6) in (_MON, _TUE, _WED):
+            holidays.append(may_6)
+        # Coming of Age Day (2nd Monday in January),
+        # was January 15th until 2000
+        if year >= 2000:
+            holidays.append(_monday_on_or_after(date(year, 1, 8).toordinal()))
+        else:
+            holidays += _observed(date(year, 1, 15).toordinal())
+        # National Foundation Day
+        holidays += _observed(date(year, 2, 11).toordinal())
+        # Emperor's Birthday (Emperor Naruhito)
+        if year >= 2020:
+            holidays += _observed(date(year, 2, 23).toordinal())
+        # Emperor's Birthday (Emperor Akihito)
+        if 1989 <= year < 2019:
+            holidays += _observed(date(year, 12, 23).toordinal())
+        # Vernal Equinox
+        holidays += _observed(date(year, 3, ve).toordinal())
+        # Greenery Day
+        holidays += _observed(date(year, 4, 29).toordinal())
+        # Marine Day (3rd Monday in July),
+        # was July 20th until 2003, not a holiday before 1996,
+        # July 23rd in 2020 due to Olympics games
+        # July 22nd in 2021 due to Olympics games
+        if (2003 <= year < 2020) or year >= 2022:
+            holidays.append(_monday_on_or_after(date(year, 7, 15).toordinal()))
+        elif 1996 <= year < 2003:
+            holidays += _observed(date(year, 7, 20).toordinal())
+        elif year == 2020:
+            holidays.append(date(year, 7, 23).toordinal())
+        elif year == 2021:
+            holidays.append(date(year, 7, 22).toordinal())
+        # Mountain Day
+        # (moved in 2020 due to Olympics games)
+        # (moved in 2021 due to Olympics games)
+        if (2016 <= year < 2020) or year >= 2022:
+            holidays += _observed(date(year, 8, 11).toordinal())
+        elif year == 2020:
+            holidays.append(date(year, 8, 10).toordinal())
+        elif year == 2021:
+            holidays.append(date(year, 8, 9).toordinal())
+        # Respect for the Aged Day (3rd Monday in September),
+        # was September 15th until 2003
+        if year >= 2003:
+            holidays.append(_monday_on_or_after(date(year, 9, 15).toordinal()))
             # If a single day falls between Respect for the Aged Day
             # and the Autumnal Equinox, it is holiday
-            or (weekday == Weekday.Tuesday and day + 1 == ae and 16 <= day <= 22
-                and month == 9 and year >= 2003)
-            # Autumnal Equinox
-            or ((day == ae or (day == ae + 1 and weekday == Weekday.Monday)) and month == 9)
-            # Health and Sports Day (2nd Monday in October),
-            # was October 10th until 2000,
-            # July 24th in 2020 due to Olympics games
-            # July 23rd in 2021 due to Olympics games
-            or (weekday == Weekday.Monday and (8 <= day <= 14) and month == 10
-                and ((2000 <= year < 2020) or year >= 2022))
-            or ((day == 10 or (day == 11 and weekday == Weekday.Monday)) and month == 10
-                and year < 2000)
-            or (day == 24 and month == 7 and year == 2020)
-            or (day == 23 and month == 7 and year == 2021)
-            # National Culture Day
-            or ((day == 3 or (day == 4 and weekday == Weekday.Monday)) and month == 11)
-            # Labor Thanksgiving Day
-            or ((day == 23 or (day == 24 and weekday == Weekday.Monday)) and month == 11)
-            # Bank Holiday
-            or (day == 31 and month == 12)
-            # one-shot holidays
-            # Marriage of Prince Akihito
-            or (day == 10 and month == 4 and year == 1959)
-            # Rites of Imperial Funeral
-            or (day == 24 and month == 2 and year == 1989)
-            # Enthronement Ceremony (Emperor Akihito)
-            or (day == 12 and month == 11 and year == 1990)
-            # Marriage of Prince Naruhito
-            or (day == 9 and month == 6 and year == 1993)
-            # Special holiday based on Japanese public holidays law
-            or (day == 30 and month == 4 and year == 2019)
-            # Enthronement Day (Emperor Naruhito)
-            or (day == 1 and month == 5 and year == 2019)
-            # Special holiday based on Japanese public holidays law
-            or (day == 2 and month == 5 and year == 2019)
-            # Enthronement Ceremony (Emperor Naruhito)
-                or (day == 22 and month == 10 and year == 2019)):
-            return False  # NOLINT(readability-simplify-boolean-expr)
-        return True
+            bridge = date(year, 9, ae).toordinal() - 1
+            if _weekday(bridge) == _TUE and 16 <= ae - 1 <= 22:
+                holidays.append(bridge)
+        else:
+            holidays += _observed(date(year, 9, 15).toordinal())
+        # Autumnal Equinox
+        holidays += _observed(date(year, 9, ae).toordinal())
+        # Health and Sports Day (2nd Monday in October),
+        # was October 10th until 2000,
+        # July 24th in 2020 due to Olympics games
+        # July 23rd in 2021 due to Olympics games
+        if (2000 <= year < 2020) or year >= 2022:
+            holidays.append(_monday_on_or_after(date(year, 10, 8).toordinal()))
+        elif year < 2000:
+            holidays += _observed(date(year, 10, 10).toordinal())
+        elif year == 2020:
+            holidays.append(date(year, 7, 24).toordinal())
+        elif year == 2021:
+            holidays.append(date(year, 7, 23).toordinal())
+        # National Culture Day
+        holidays += _observed(date(year, 11, 3).toordinal())
+        # Labor Thanksgiving Day
+        holidays += _observed(date(year, 11, 23).toordinal())
+        # one-shot holidays
+        holidays += [date(year, month, day).toordinal()
+                     for month, day in _ONE_SHOT_HOLIDAYS.get(year, [])]
+        return [ordinal for ordinal in holidays if _weekday(ordinal) < _SAT]
@@ -2,6 +2,8 @@ from datetime import datetime
 from enum import Enum
 from typing import List
 
+import numpy as np
+
 from qtmodel.error import QTError
 from qtmodel.time.calendar import Calendar
 from qtmodel.time.weekday import Weekday
@@ -26,51 +28,76 @@ class JointCalendar(Calendar):
     """
     added_holidays = set()
     removed_holidays = set()
+    # the joined calendars can be modified at any time
+    _fixed_rules = False
 
     def __init__(self,
                  calendars: List[Calendar],
                  joint_calendar_rule: JointCalendarRule = JointCalendarRule.JoinHolidays):
-        self.calendars = calendars
+        # splice in nested joints with the same rule and drop repeated
+        # instances, so each calendar is only queried once
+        flat = []
+        for calendar in calendars:
+            if isinstance(calendar, JointCalendar) and \
+                    calendar.joint_calendar_rule == joint_calendar_rule:
+                flat.extend(calendar.calendars)
+            else:
+                flat.append(calendar)
+        self.calendars = tuple({id(calendar): calendar for calendar in flat}.values())
         self.joint_calendar_rule = joint_calendar_rule
-
-    def name(self) -> str:
+        # holiday ordinals per year, valid as long as no calendar is changed
+        self._holidays_by_year = {}
+        self._changes = Calendar._changes
         out_str = ""
+        # bind the rule's predicates once, instead of dispatching on every call
         if self.joint_calendar_rule == JointCalendarRule.JoinHolidays:
             out_str += "JoinHolidays("
+            self.is_weekend = self._is_weekend_join_holidays
         elif self.joint_calendar_rule == JointCalendarRule.JoinBusinessDays:
             out_str += "JoinBusinessDays("
+            self.is_weekend = self._is_weekend_join_business_days
         else:
             raise QTError("unknown joint calendar rule")
         out_str += self.calendars[0].name()
         for calendar in self.calendars[1:]:
             out_str += f", {calendar.name()}"
         out_str += ")"
-        return out_str
+        self._name = out_str
 
-    def is_weekend(self, w: Weekday) -> bool:
-        if self.joint_calendar_rule == JointCalendarRule.JoinHolidays:
-            for calendar in self.calendars:
-                if calendar.is_weekend(w=w):
-                    return True
-            return False
-        elif self.joint_calendar_rule == JointCalendarRule.JoinBusinessDays:
-            for calendar in self.calendars:
-                if not calendar.is_weekend(w=w):
-                    return False
-            return True
-        else:
-            raise QTError("unknown joint calendar rule")
+    def _is_weekend_join_holidays(self, w: Weekday) -> bool:
+        return any(calendar.is_weekend(w) for calendar in self.calendars)
+
+    def _is_weekend_join_business_days(self, w: Weekday) -> bool:
+        return all(calendar.is_weekend(w) for calendar in self.calendars)
 
     def _is_business_day(self, date: datetime) -> bool:
+        return date.toordinal() not in self._holiday_ordinals(date.year)
+
+    def _holiday_ordinals(self, year: int) -> frozenset:
+        """
+        :param year:
+        :return: union (when joining holidays) or intersection (when joining business
+                 days) of the holiday ordinals of the given calendars for that year
+        """
+        if self._changes != Calendar._changes:
+            self._holidays_by_year.clear()
+            self._changes = Calendar._changes
+        holidays = self._holidays_by_year.get(year)
+        if holidays is None:
+            ordinals = [calendar._holiday_ordinals(year) for calendar in self.calendars]
+            if self.joint_calendar_rule == JointCalendarRule.JoinHolidays:
+                holidays = frozenset.union(*ordinals)
+            else:
+                holidays = frozenset.intersection(*ordinals)
+            self._holidays_by_year[year] = holidays
+        return holidays
+
+    def _build_year_holiday_mask(self, year: int) -> np.ndarray:
+        masks = [calendar._holiday_mask(datetime(year, 1, 1), datetime(year, 12, 31))
+                 for calendar in self.calendars]
         if self.joint_calendar_rule == JointCalendarRule.JoinHolidays:
-            for calendar in self.calendars:
-                if calendar.is_holiday(date=date):
-                    return False
-            return True
+            return np.logical_or.reduce(masks)
         elif self.joint_calendar_rule == JointCalendarRule.JoinBusinessDays:
-            for calendar in self.calendars:
-                if calendar.is_business_day(date=date):
-                    return True
-            return False
+            return np.logical_and.reduce(masks)
         else:
             raise QTError("unknown joint calendar rule")
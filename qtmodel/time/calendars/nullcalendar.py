@@ -1,5 +1,7 @@
 from datetime import datetime
 
+import numpy as np
+
 from qtmodel.time.calendar import Calendar, CalendarTypes
 from qtmodel.time.weekday import Weekday
 
@@ -10,6 +12,7 @@ class NullCalendar(Calendar):
     This calendar has no holidays. It ensures that dates at
     whole-month distances have the same day of month.
     """
+    __slots__ = ()
     added_holidays = set()
     removed_holidays = set()
 
@@ -22,3 +25,6 @@ class NullCalendar(Calendar):
 
     def _is_business_day(self, date: datetime) -> bool:
         return True
+
+    def _build_year_holiday_mask(self, year: int) -> np.ndarray:
+        return np.zeros((datetime(year + 1, 1, 1) - datetime(year, 1, 1)).days, dtype=bool)
@@ -1,7 +1,8 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime
 
-from qtmodel.time.calendar import Calendar, CalendarTypes, EasterMondayTypes
-from qtmodel.time.date import DateTool
+import numpy as np
+
+from qtmodel.time.calendar import Calendar, CalendarTypes, _SAT, _western_easter_monday_ordinals
 
 
 class TARGET(Calendar):
@@ -18,6 +19,7 @@ class TARGET(Calendar):
     Day of Goodwill, December 26th (since 2000)
     December 31st (1998, 1999, and 2001)
     """
+    __slots__ = ()
     added_holidays = set()
     removed_holidays = set()
 
@@ -25,31 +27,33 @@ class TARGET(Calendar):
         super().__init__(calendar_type=CalendarTypes.TARGET)
 
     def _is_business_day(self, date: datetime) -> bool:
-        """
-        :param date:
-        :return:
-        """
-        year = date.year
-        month = date.month
-        weekday = DateTool.weekday(date=date)
-        day = date.day
-        easter_monday = self.easter_monday(year=year,
-                                           easter_monday_type=EasterMondayTypes.Western)
-        if (self.is_weekend(weekday)
-                # New Year's Day
-                or (day == 1 and month == 1)
+        if date.weekday() >= _SAT:
+            return False
+        return date.toordinal() not in self._year_holidays(date.year)
+
+    def _build_year_holiday_mask(self, year: int) -> np.ndarray:
+        return self._build_weekend_and_holiday_mask(year)
+
+    def _build_year(self, year: int):
+        holidays = [
+            # New Year's Day
+            date(year, 1, 1).toordinal(),
+            # Christmas
+            date(year, 12, 25).toordinal()
+        ]
+        if year >= 2000:
+            easter_monday = _western_easter_monday_ordinals[year - 1901]
+            holidays += [
                 # Good Friday
-                or (date == easter_monday - timedelta(days=3) and year >= 2000)
+                easter_monday - 3,
                 # Easter Monday
-                or (date == easter_monday and year >= 2000)
+                easter_monday,
                 # Labour Day
-                or (day == 1 and month == 5 and year >= 2000)
-                # Christmas
-                or (day == 25 and month == 12)
+                date(year, 5, 1).toordinal(),
                 # Day of Goodwill
-                or (day == 26 and month == 12 and year >= 2000)
-                # December 31st, 1998, 1999, and 2001 only
-                or (day == 31 and month == 12 and
-                    (year == 1998 or year == 1999 or year == 2001))):
-            return False  # NOLINT(readability-simplify-boolean-expr)
-        return True
+                date(year, 12, 26).toordinal()
+            ]
+        # December 31st, 1998, 1999, and 2001 only
+        if year in (1998, 1999, 2001):
+            holidays.append(date(year, 12, 31).toordinal())
+        return holidays
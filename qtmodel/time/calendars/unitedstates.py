@@ -1,8 +1,13 @@
-from datetime import datetime, timedelta
+from array import array
+from datetime import date, datetime
+from functools import lru_cache
+
+import numpy as np
 
 from qtmodel.error import QTError
-from qtmodel.time.calendar import CalendarTypes, Calendar, EasterMondayTypes
-from qtmodel.time.date import DateTool
+from qtmodel.time.calendar import CalendarTypes, Calendar, _MON, _TUE, _WED, _THU, _FRI, _SAT, _SUN, \
+    _weekday, _year_start, _western_easter_monday_ordinals
+from qtmodel.time.date import _month_length
 from qtmodel.time.weekday import Weekday
 
 us_calendar_types = [
@@ -14,11 +19,106 @@ us_calendar_types = [
     CalendarTypes.UNITED_STATES_FEDERAL_RESERVE
 ]
 
+# Good Friday as day ordinals, indexed by year - 1901
+_good_friday_ordinals = array('l', [easter_monday - 3 for easter_monday in _western_easter_monday_ordinals])
+
+
+def _key(month: int, day: int, weekday: int) -> int:
+    """ packs a day of the year and its day of the week into a small integer """
+    return (month << 9) | (day << 4) | weekday
+
+
+def _observed(month: int, day: int, to_friday: bool = True):
+    """
+    :param month:
+    :param day:
+    :param to_friday: whether the holiday moves to Friday when on Saturday
+    :return: keys of the holiday, moved to Monday if on Sunday
+    """
+    keys = [_key(month, day, weekday) for weekday in range(7)]
+    keys.append(_key(month, day + 1, _MON))
+    if to_friday:
+        keys.append(_key(month, day - 1, _FRI))
+    return keys
+
+
+# holidays on a fixed date, moved to Monday if on Sunday or Friday if on Saturday
+_washington_birthday_before_1971 = frozenset(_observed(2, 22))
+_memorial_day_before_1971 = frozenset(_observed(5, 30))
+_juneteenth = frozenset(_observed(6, 19))
+_veterans_day = frozenset(_observed(11, 11))
+# Veteran's Day, not moved to Friday if on Saturday
+_veterans_day_no_saturday = frozenset(_observed(11, 11, to_friday=False))
+
+# June 11th, 1968: day 163 of the year, from which the NYSE closed on Wednesdays
+_paperwork_crisis_start = date(1968, 6, 11).toordinal()
+# special closings of the New York stock exchange, as day ordinals
+_nyse_special_closings = frozenset(date(*ymd).toordinal() for ymd in [
+    # President Bush's Funeral
+    (2018, 12, 5),
+    # Hurricane Sandy
+    (2012, 10, 29), (2012, 10, 30),
+    # President Ford's funeral
+    (2007, 1, 2),
+    # President Reagan's funeral
+    (2004, 6, 11),
+    # September 11-14, 2001
+    (2001, 9, 11), (2001, 9, 12), (2001, 9, 13), (2001, 9, 14),
+    # President Nixon's funeral
+    (1994, 4, 27),
+    # Hurricane Gloria
+    (1985, 9, 27),
+    # 1977 Blackout
+    (1977, 7, 14),
+    # Funeral of former President Lyndon B. Johnson.
+    (1973, 1, 25),
+    # Funeral of former President Harry S. Truman
+    (1972, 12, 28),
+    # National Day of Participation for the lunar exploration.
+    (1969, 7, 21),
+    # Funeral of former President Eisenhower.
+    (1969, 3, 31),
+    # Closed all day - heavy snow.
+    (1969, 2, 10),
+    # Day after Independence Day.
+    (1968, 7, 5),
+    # Day of mourning for Martin Luther King Jr.
+    (1968, 4, 9),
+    # Funeral of President Kennedy
+    (1963, 11, 25),
+    # Day before Decoration Day
+    (1961, 5, 29),
+    # Day after Christmas
+    (1958, 12, 26),
+    # Christmas Eve
+    (1954, 12, 24), (1956, 12, 24), (1965, 12, 24)])
+# special closings of the government bond market, as day ordinals
+_government_bond_special_closings = frozenset(date(*ymd).toordinal() for ymd in [
+    # President Bush's Funeral
+    (2018, 12, 5),
+    # Hurricane Sandy
+    (2012, 10, 30),
+    # President Reagan's funeral
+    (2004, 6, 11)])
+
+# New Year's Day, Independence Day and Christmas
+_settlement_fixed_holidays = frozenset(
+    _observed(1, 1, to_friday=False)
+    # New Year's Day on a Saturday, moved to Friday
+    + [_key(12, 31, _FRI)]
+    + _observed(7, 4) + _observed(12, 25))
+_exchange_fixed_holidays = frozenset(
+    _observed(1, 1, to_friday=False) + _observed(7, 4) + _observed(12, 25))
+_no_saturday_fixed_holidays = frozenset(
+    _observed(1, 1, to_friday=False) + _observed(7, 4, to_friday=False)
+    + _observed(12, 25, to_friday=False))
+
 
 class UnitedStates(Calendar):
     """
     United States Calendar
     """
+    __slots__ = ('_rule',)
     added_holidays = set()
     removed_holidays = set()
 
@@ -27,259 +127,304 @@ class UnitedStates(Calendar):
             raise QTError("unknown market")
         else:
             super().__init__(calendar_type=calendar_type)
+            # the rule of the market, bound once instead of dispatched per day
+            self._rule = UnitedStates._DISPATCH[calendar_type].__get__(self)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get(calendar_type: CalendarTypes) -> 'UnitedStates':
+        """
+        :param calendar_type:
+        :return: an instance shared by all callers asking for the same market
+        """
+        return UnitedStates(calendar_type)
 
     def _is_business_day(self, date: datetime) -> bool:
         """
         :param date:
         :return:
         """
-        if self.calendar_type == CalendarTypes.UNITED_STATES_SETTLEMENT:
-            return self._is_business_day_us_settlement(date=date)
-        elif self.calendar_type == CalendarTypes.UNITED_STATES_LIBOR_IMPACT:
-            return self._is_business_day_us_libor_impact(date=date)
-        elif self.calendar_type == CalendarTypes.UNITED_STATES_NYSE:
-            return self._is_business_day_us_nyse(date=date)
-        elif self.calendar_type == CalendarTypes.UNITED_STATES_GOVERNMENT_BOND:
-            return self._is_business_day_us_government_bond(date=date)
-        elif self.calendar_type == CalendarTypes.UNITED_STATES_NERC:
-            return self._is_business_day_us_nerc(date=date)
-        elif self.calendar_type == CalendarTypes.UNITED_STATES_FEDERAL_RESERVE:
-            return self._is_business_day_us_federal_reserve(date=date)
-
-    def _is_business_day_us_settlement(self, date: datetime) -> bool:
-        year = date.year
-        month = date.month
-        weekday = DateTool.weekday(date=date)
-        day = date.day
-        if (self.is_weekend(weekday)
-                # New Year's Day (possibly moved to Monday if on Sunday)
-                or ((day == 1 or (day == 2 and weekday == Weekday.Monday)) and month == 1)
-                # (or to Friday if on Saturday)
-                or (day == 31 and weekday == Weekday.Friday and month == 12)
-                # Martin Luther King's birthday (third Monday in January)
-                or ((15 <= day <= 21) and weekday == Weekday.Monday and month == 1
-                    and year >= 1983)
-                # Washington's birthday (third Monday in February)
-                or self.is_washington_birthday(year, month, weekday, day)
-                # Memorial Day (last Monday in May)
-                or self.is_memorial_day(year, month, weekday, day)
-                # Juneteenth (Monday if Sunday or Friday if Saturday)
-                or self.is_juneteenth(year, month, weekday, day)
-                # Independence Day (Monday if Sunday or Friday if Saturday)
-                or ((day == 4 or (day == 5 and weekday == Weekday.Monday) or
-                     (day == 3 and weekday == Weekday.Friday)) and month == 7)
-                # Labor Day (first Monday in September)
-                or self.is_labor_day(month, weekday, day)
-                # Columbus Day (second Monday in October)
-                or self.is_columbus_day(year, month, weekday, day)
-                # Veteran's Day (Monday if Sunday or Friday if Saturday)
-                or self.is_veterans_day(year, month, weekday, day)
-                # Thanksgiving Day (fourth Thursday in November)
-                or ((22 <= day <= 28) and weekday == Weekday.Thursday and month == 11)
-                # Christmas (Monday if Sunday or Friday if Saturday)
-                or ((day == 25 or (day == 26 and weekday == Weekday.Monday) or
-                     (day == 24 and weekday == Weekday.Friday)) and month == 12)):
-            return False  # NOLINT(readability-simplify-boolean-expr)
-        return True
+        return self._rule(date.year, date.month, date.day, date.weekday(), date.toordinal())
 
-    def _is_business_day_us_libor_impact(self, date: datetime) -> bool:
-        year = date.year
-        month = date.month
-        weekday = DateTool.weekday(date=date)
-        day = date.day
-        if (((day == 5 and weekday == Weekday.Monday) or
-             (day == 3 and weekday == Weekday.Friday)) and month == 7 and year >= 2015):
-            return True
-        return self._is_business_day_us_settlement(date=date)
-
-    def _is_business_day_us_nyse(self, date: datetime) -> bool:
-        year = date.year
-        month = date.month
-        weekday = DateTool.weekday(date=date)
-        day = date.day
-        day_of_year = DateTool.day_of_year(date=date)
-        easter_monday = self.easter_monday(year=year,
-                                           easter_monday_type=EasterMondayTypes.Western)
-        if (self.is_weekend(weekday)
-                # New Year's Day (possibly moved to Monday if on Sunday)
-                or ((day == 1 or (day == 2 and weekday == Weekday.Monday)) and month == 1)
-                # Washington's birthday (third Monday in February)
-                or self.is_washington_birthday(year=year, month=month, weekday=weekday, day=day)
-                # Good Friday
-                or (date == easter_monday - timedelta(days=3))
-                # Memorial Day (last Monday in May)
-                or self.is_memorial_day(year=year, month=month, weekday=weekday, day=day)
-                # Juneteenth (Monday if Sunday or Friday if Saturday)
-                or self.is_juneteenth(year=year, month=month, weekday=weekday, day=day)
-                # Independence Day (Monday if Sunday or Friday if Saturday)
-                or ((day == 4 or (day == 5 and weekday == Weekday.Monday) or
-                     (day == 3 and weekday == Weekday.Friday)) and month == 7)
-                # Labor Day (first Monday in September)
-                or self.is_labor_day(month=month, weekday=weekday, day=day)
-                # Thanksgiving Day (fourth Thursday in November)
-                or ((22 <= day <= 28) and weekday == Weekday.Thursday and month == 11)
-                # Christmas (Monday if Sunday or Friday if Saturday)
-                or ((day == 25 or (day == 26 and weekday == Weekday.Monday) or
-                     (day == 24 and weekday == Weekday.Friday)) and month == 12)):
-            return False
+    def _build_year_holiday_mask(self, year: int) -> np.ndarray:
+        # walk the year on integers, without building a datetime per day
+        ordinal = _year_start(year)
+        weekday = _weekday(ordinal)
+        rule = self._rule
+        mask = []
+        for month in range(1, 13):
+            for day in range(1, _month_length(year, month) + 1):
+                mask.append(not rule(year, month, day, weekday, ordinal))
+                ordinal += 1
+                weekday = weekday + 1 if weekday < _SUN else _MON
+        return np.array(mask)
 
-        if (year >= 1998 and 15 <= day <= 21
-                and weekday == Weekday.Monday and month == 1):
+    def _is_business_day_us_settlement(self, year: int, month: int, day: int, weekday: int, ordinal: int) -> bool:
+        if weekday >= _SAT:
+            return False
+        # New Year's Day (possibly moved to Monday if on Sunday,
+        # or to Friday if on Saturday), Independence Day and Christmas
+        # (Monday if Sunday or Friday if Saturday)
+        key = _key(month, day, weekday)
+        if key in _settlement_fixed_holidays:
+            return False
+        # the other holidays never leave their month
+        if month == 1:
             # Martin Luther King's birthday (third Monday in January)
+            if (15 <= day <= 21) and weekday == _MON and year >= 1983:
+                return False
+        elif month == 2:
+            # Washington's birthday (third Monday in February,
+            # February 22nd possibly adjusted before 1971)
+            if year >= 1971:
+                if (15 <= day <= 21) and weekday == _MON:
+                    return False
+            elif key in _washington_birthday_before_1971:
+                return False
+        elif month == 5:
+            # Memorial Day (last Monday in May,
+            # May 30th possibly adjusted before 1971)
+            if year >= 1971:
+                if day >= 25 and weekday == _MON:
+                    return False
+            elif key in _memorial_day_before_1971:
+                return False
+        elif month == 6:
+            # Juneteenth (Monday if Sunday or Friday if Saturday)
+            if year >= 2022 and key in _juneteenth:
+                return False
+        elif month == 9:
+            # Labor Day (first Monday in September)
+            if day <= 7 and weekday == _MON:
+                return False
+        elif month == 10:
+            if weekday == _MON and year >= 1971 and (
+                    # Columbus Day (second Monday in October)
+                    (8 <= day <= 14)
+                    # Veteran's Day (fourth Monday in October, 1971 to 1977)
+                    or ((22 <= day <= 28) and year <= 1977)):
+                return False
+        elif month == 11:
+            if (  # Veteran's Day (Monday if Sunday or Friday if Saturday)
+                    (not 1971 <= year <= 1977 and key in _veterans_day)
+                    # Thanksgiving Day (fourth Thursday in November)
+                    or ((22 <= day <= 28) and weekday == _THU)):
+                return False
+        return True
+
+    def _is_business_day_us_libor_impact(self, year: int, month: int, day: int, weekday: int, ordinal: int) -> bool:
+        if weekday >= _SAT:
             return False
+        if (((day == 5 and weekday == _MON) or
+             (day == 3 and weekday == _FRI)) and month == 7 and year >= 2015):
+            return True
+        return self._is_business_day_us_settlement(year, month, day, weekday, ordinal)
 
-        if ((year <= 1968 or (year <= 1980 and year % 4 == 0)) and month == 11
-                and day <= 7 and weekday == Weekday.Tuesday):
-            # Presidential election days
+    def _is_business_day_us_nyse(self, year: int, month: int, day: int, weekday: int, ordinal: int) -> bool:
+        if weekday >= _SAT:
+            return False
+        # New Year's Day (possibly moved to Monday if on Sunday), Independence Day
+        # and Christmas (Monday if Sunday or Friday if Saturday)
+        key = _key(month, day, weekday)
+        if key in _exchange_fixed_holidays:
             return False
+        # the other holidays never leave their month
+        if month == 1:
+            # Martin Luther King's birthday (third Monday in January)
+            if year >= 1998 and 15 <= day <= 21 and weekday == _MON:
+                return False
+        elif month == 2:
+            # Washington's birthday (third Monday in February,
+            # February 22nd possibly adjusted before 1971)
+            if year >= 1971:
+                if (15 <= day <= 21) and weekday == _MON:
+                    return False
+            elif key in _washington_birthday_before_1971:
+                return False
+        elif month == 3 or month == 4:
+            # Good Friday
+            if ordinal == _good_friday_ordinals[year - 1901]:
+                return False
+        elif month == 5:
+            # Memorial Day (last Monday in May,
+            # May 30th possibly adjusted before 1971)
+            if year >= 1971:
+                if day >= 25 and weekday == _MON:
+                    return False
+            elif key in _memorial_day_before_1971:
+                return False
+        elif month == 6:
+            # Juneteenth (Monday if Sunday or Friday if Saturday)
+            if year >= 2022 and key in _juneteenth:
+                return False
+        elif month == 9:
+            # Labor Day (first Monday in September)
+            if day <= 7 and weekday == _MON:
+                return False
+        elif month == 11:
+            if (  # Thanksgiving Day (fourth Thursday in November)
+                    ((22 <= day <= 28) and weekday == _THU)
+                    # Presidential election days
+                    or ((year <= 1968 or (year <= 1980 and year % 4 == 0))
+                        and day <= 7 and weekday == _TUE)):
+                return False
 
         # Special closings
-        if (  # President Bush's Funeral
-                (year == 2018 and month == 12 and day == 5)
-                # Hurricane Sandy
-                or (year == 2012 and month == 10 and (day == 29 or day == 30))
-                # President Ford's funeral
-                or (year == 2007 and month == 1 and day == 2)
-                # President Reagan's funeral
-                or (year == 2004 and month == 6 and day == 11)
-                # September 11-14, 2001
-                or (year == 2001 and month == 9 and (11 <= day <= 14))
-                # President Nixon's funeral
-                or (year == 1994 and month == 4 and day == 27)
-                # Hurricane Gloria
-                or (year == 1985 and month == 9 and day == 27)
-                # 1977 Blackout
-                or (year == 1977 and month == 7 and day == 14)
-                # Funeral of former President Lyndon B. Johnson.
-                or (year == 1973 and month == 1 and day == 25)
-                # Funeral of former President Harry S. Truman
-                or (year == 1972 and month == 12 and day == 28)
-                # National Day of Participation for the lunar exploration.
-                or (year == 1969 and month == 7 and day == 21)
-                # Funeral of former President Eisenhower.
-                or (year == 1969 and month == 3 and day == 31)
-                # Closed all day - heavy snow.
-                or (year == 1969 and month == 2 and day == 10)
-                # Day after Independence Day.
-                or (year == 1968 and month == 7 and day == 5)
+        if (ordinal in _nyse_special_closings
                 # June 12-Dec. 31, 1968
                 # Four day week (closed on Wednesdays) - Paperwork Crisis
-                or (year == 1968 and day_of_year >= 163 and weekday == Weekday.Wednesday)
-                # Day of mourning for Martin Luther King Jr.
-                or (year == 1968 and month == 4 and day == 9)
-                # Funeral of President Kennedy
-                or (year == 1963 and month == 11 and day == 25)
-                # Day before Decoration Day
-                or (year == 1961 and month == 5 and day == 29)
-                # Day after Christmas
-                or (year == 1958 and month == 12 and day == 26)
-                # Christmas Eve
-                or ((year == 1954 or year == 1956 or year == 1965)
-                    and month == 12 and day == 24)):
+                or (year == 1968 and weekday == _WED and ordinal >= _paperwork_crisis_start)):
             return False
         return True
 
-    def _is_business_day_us_government_bond(self, date: datetime) -> bool:
-        year = date.year
-        month = date.month
-        weekday = DateTool.weekday(date=date)
-        day = date.day
-        easter_monday = self.easter_monday(year=year,
-                                           easter_monday_type=EasterMondayTypes.Western)
-        if (self.is_weekend(weekday)
-                # New Year's Day (possibly moved to Monday if on Sunday)
-                or ((day == 1 or (day == 2 and weekday == Weekday.Monday)) and month == 1)
-                # Martin Luther King's birthday (third Monday in January)
-                or ((15 <= day <= 21) and weekday == Weekday.Monday and month == 1
-                    and year >= 1983)
-                # Washington's birthday (third Monday in February)
-                or self.is_washington_birthday(year=year, month=month, weekday=weekday, day=day)
-                # Good Friday (2015 was half day due to NFP report)
-                or ((date == easter_monday - timedelta(days=3)) and year != 2015)
-                # Memorial Day (last Monday in May)
-                or self.is_memorial_day(year=year, month=month, weekday=weekday, day=day)
-                # Juneteenth (Monday if Sunday or Friday if Saturday)
-                or self.is_juneteenth(year=year, month=month, weekday=weekday, day=day)
-                # Independence Day (Monday if Sunday or Friday if Saturday)
-                or ((day == 4 or (day == 5 and weekday == Weekday.Monday) or
-                     (day == 3 and weekday == Weekday.Friday)) and month == 7)
-                # Labor Day (first Monday in September)
-                or self.is_labor_day(month=month, weekday=weekday, day=day)
-                # Columbus Day (second Monday in October)
-                or self.is_columbus_day(year=year, month=month, weekday=weekday, day=day)
-                # Veteran's Day (Monday if Sunday)
-                or self.is_veterans_day_no_saturday(year=year, month=month, weekday=weekday, day=day)
-                # Thanksgiving Day (fourth Thursday in November)
-                or ((22 <= day <= 28) and weekday == Weekday.Thursday and month == 11)
-                # Christmas (Monday if Sunday or Friday if Saturday)
-                or ((day == 25 or (day == 26 and weekday == Weekday.Monday) or
-                     (day == 24 and weekday == Weekday.Friday)) and month == 12)):
+    def _is_business_day_us_government_bond(self, year: int, month: int, day: int, weekday: int, ordinal: int) -> bool:
+        if weekday >= _SAT:
+            return False
+        # New Year's Day (possibly moved to Monday if on Sunday), Independence Day
+        # and Christmas (Monday if Sunday or Friday if Saturday)
+        key = _key(month, day, weekday)
+        if key in _exchange_fixed_holidays:
             return False
+        # the other holidays never leave their month
+        if month == 1:
+            # Martin Luther King's birthday (third Monday in January)
+            if (15 <= day <= 21) and weekday == _MON and year >= 1983:
+                return False
+        elif month == 2:
+            # Washington's birthday (third Monday in February,
+            # February 22nd possibly adjusted before 1971)
+            if year >= 1971:
+                if (15 <= day <= 21) and weekday == _MON:
+                    return False
+            elif key in _washington_birthday_before_1971:
+                return False
+        elif month == 3 or month == 4:
+            # Good Friday (2015 was half day due to NFP report)
+            if ordinal == _good_friday_ordinals[year - 1901] and year != 2015:
+                return False
+        elif month == 5:
+            # Memorial Day (last Monday in May,
+            # May 30th possibly adjusted before 1971)
+            if year >= 1971:
+                if day >= 25 and weekday == _MON:
+                    return False
+            elif key in _memorial_day_before_1971:
+                return False
+        elif month == 6:
+            # Juneteenth (Monday if Sunday or Friday if Saturday)
+            if year >= 2022 and key in _juneteenth:
+                return False
+        elif month == 9:
+            # Labor Day (first Monday in September)
+            if day <= 7 and weekday == _MON:
+                return False
+        elif month == 10:
+            if weekday == _MON and year >= 1971 and (
+                    # Columbus Day (second Monday in October)
+                    (8 <= day <= 14)
+                    # Veteran's Day (fourth Monday in October, 1971 to 1977)
+                    or ((22 <= day <= 28) and year <= 1977)):
+                return False
+        elif month == 11:
+            if (  # Veteran's Day (Monday if Sunday)
+                    (not 1971 <= year <= 1977 and key in _veterans_day_no_saturday)
+                    # Thanksgiving Day (fourth Thursday in November)
+                    or ((22 <= day <= 28) and weekday == _THU)):
+                return False
 
-            # Special closings
-        if (  # President Bush's Funeral
-                (year == 2018 and month == 12 and day == 5)
-                # Hurricane Sandy
-                or (year == 2012 and month == 10 and (day == 30))
-                # President Reagan's funeral
-                or (year == 2004 and month == 6 and day == 11)):
+        # Special closings
+        if ordinal in _government_bond_special_closings:
             return False
         return True
 
-    def _is_business_day_us_nerc(self, date: datetime) -> bool:
-        year = date.year
-        month = date.month
-        weekday = DateTool.weekday(date=date)
-        day = date.day
-        if (self.is_weekend(weekday)
-                # New Year's Day (possibly moved to Monday if on Sunday)
-                or ((day == 1 or (day == 2 and weekday == Weekday.Monday)) and month == 1)
-                # Memorial Day (last Monday in May)
-                or self.is_memorial_day(year=year, month=month, weekday=weekday, day=day)
-                # Independence Day (Monday if Sunday)
-                or ((day == 4 or (day == 5 and weekday == Weekday.Monday)) and month == 7)
-                # Labor Day (first Monday in September)
-                or self.is_labor_day(month=month, weekday=weekday, day=day)
-                # Thanksgiving Day (fourth Thursday in November)
-                or ((22 <= day <= 28) and weekday == Weekday.Thursday and month == 11)
-                # Christmas (Monday if Sunday)
-                or ((day == 25 or (day == 26 and weekday == Weekday.Monday)) and month == 12)):
-            return False  # NOLINT(readability-simplify-boolean-expr)
+    def _is_business_day_us_nerc(self, year: int, month: int, day: int, weekday: int, ordinal: int) -> bool:
+        if weekday >= _SAT:
+            return False
+        # New Year's Day, Independence Day and Christmas
+        # (possibly moved to Monday if on Sunday)
+        key = _key(month, day, weekday)
+        if key in _no_saturday_fixed_holidays:
+            return False
+        if month == 5:
+            # Memorial Day (last Monday in May,
+            # May 30th possibly adjusted before 1971)
+            if year >= 1971:
+                if day >= 25 and weekday == _MON:
+                    return False
+            elif key in _memorial_day_before_1971:
+                return False
+        elif month == 9:
+            # Labor Day (first Monday in September)
+            if day <= 7 and weekday == _MON:
+                return False
+        elif month == 11:
+            # Thanksgiving Day (fourth Thursday in November)
+            if (22 <= day <= 28) and weekday == _THU:
+                return False
         return True
 
-    def _is_business_day_us_federal_reserve(self, date: datetime) -> bool:
+    def _is_business_day_us_federal_reserve(self, year: int, month: int, day: int, weekday: int, ordinal: int) -> bool:
         # see https://www.frbservices.org/holidayschedules/ for details
-        year = date.year
-        month = date.month
-        weekday = DateTool.weekday(date=date)
-        day = date.day
-        if (self.is_weekend(weekday)
-                # New Year's Day (possibly moved to Monday if on Sunday)
-                or ((day == 1 or (day == 2 and weekday == Weekday.Monday)) and month == 1)
-                # Martin Luther King's birthday (third Monday in January)
-                or ((15 <= day <= 21) and weekday == Weekday.Monday and month == 1
-                    and year >= 1983)
-                # Washington's birthday (third Monday in February)
-                or self.is_washington_birthday(year=year, month=month, weekday=weekday, day=day)
-                # Memorial Day (last Monday in May)
-                or self.is_memorial_day(year=year, month=month, weekday=weekday, day=day)
-                # Juneteenth (Monday if Sunday or Friday if Saturday)
-                or self.is_juneteenth(year=year, month=month, weekday=weekday, day=day)
-                # Independence Day (Monday if Sunday)
-                or ((day == 4 or (day == 5 and weekday == Weekday.Monday)) and month == 7)
-                # Labor Day (first Monday in September)
-                or self.is_labor_day(month=month, weekday=weekday, day=day)
-                # Columbus Day (second Monday in October)
-                or self.is_columbus_day(year=year, month=month, weekday=weekday, day=day)
-                # Veteran's Day (Monday if Sunday)
-                or self.is_veterans_day_no_saturday(year=year, month=month, weekday=weekday, day=day)
-                # Thanksgiving Day (fourth Thursday in November)
-                or ((22 <= day <= 28) and weekday == Weekday.Thursday and month == 11)
-                # Christmas (Monday if Sunday)
-                or ((day == 25 or (day == 26 and weekday == Weekday.Monday)) and month == 12)):
-            return False  # NOLINT(readability-simplify-boolean-expr)
+        if weekday >= _SAT:
+            return False
+        # New Year's Day, Independence Day and Christmas
+        # (possibly moved to Monday if on Sunday)
+        key = _key(month, day, weekday)
+        if key in _no_saturday_fixed_holidays:
+            return False
+        # the other holidays never leave their month
+        if month == 1:
+            # Martin Luther King's birthday (third Monday in January)
+            if (15 <= day <= 21) and weekday == _MON and year >= 1983:
+                return False
+        elif month == 2:
+            # Washington's birthday (third Monday in February,
+            # February 22nd possibly adjusted before 1971)
+            if year >= 1971:
+                if (15 <= day <= 21) and weekday == _MON:
+                    return False
+            elif key in _washington_birthday_before_1971:
+                return False
+        elif month == 5:
+            # Memorial Day (last Monday in May,
+            # May 30th possibly adjusted before 1971)
+            if year >= 1971:
+                if day >= 25 and weekday == _MON:
+                    return False
+            elif key in _memorial_day_before_1971:
+                return False
+        elif month == 6:
+            # Juneteenth (Monday if Sunday or Friday if Saturday)
+            if year >= 2022 and key in _juneteenth:
+                return False
+        elif month == 9:
+            # Labor Day (first Monday in September)
+            if day <= 7 and weekday == _MON:
+                return False
+        elif month == 10:
+            if weekday == _MON and year >= 1971 and (
+                    # Columbus Day (second Monday in October)
+                    (8 <= day <= 14)
+                    # Veteran's Day (fourth Monday in October, 1971 to 1977)
+                    or ((22 <= day <= 28) and year <= 1977)):
+                return False
+        elif month == 11:
+            if (  # Veteran's Day (Monday if Sunday)
+                    (not 1971 <= year <= 1977 and key in _veterans_day_no_saturday)
+                    # Thanksgiving Day (fourth Thursday in November)
+                    or ((22 <= day <= 28) and weekday == _THU)):
+                return False
         return True
 
+    _DISPATCH = {
+        CalendarTypes.UNITED_STATES_SETTLEMENT: _is_business_day_us_settlement,
+        CalendarTypes.UNITED_STATES_LIBOR_IMPACT: _is_business_day_us_libor_impact,
+        CalendarTypes.UNITED_STATES_NYSE: _is_business_day_us_nyse,
+        CalendarTypes.UNITED_STATES_GOVERNMENT_BOND: _is_business_day_us_government_bond,
+        CalendarTypes.UNITED_STATES_NERC: _is_business_day_us_nerc,
+        CalendarTypes.UNITED_STATES_FEDERAL_RESERVE: _is_business_day_us_federal_reserve,
+    }
+
     @staticmethod
     def is_washington_birthday(year: int,
                                month: int,
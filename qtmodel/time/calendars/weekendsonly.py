@@ -1,19 +1,19 @@
 from datetime import datetime
 
 from qtmodel.error import QTError
-from qtmodel.time.calendar import Calendar, CalendarTypes
-from qtmodel.time.date import DateTool
+from qtmodel.time.calendar import Calendar, CalendarTypes, _SAT
 
 
 class WeekendsOnly(Calendar):
     """
     Weekend Calendar
     """
+    __slots__ = ()
     added_holidays = set()
     removed_holidays = set()
+
     def __init__(self):
         super().__init__(calendar_type=CalendarTypes.WEEKEND)
 
     def _is_business_day(self, date: datetime) -> bool:
-        weekday = DateTool.weekday(date=date)
-        return not self.is_weekend(w=weekday)
+        return date.weekday() < _SAT
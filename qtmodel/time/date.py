@@ -1,11 +1,52 @@
-import calendar
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from qtmodel.error import QTError, qt_require
 from qtmodel.time.period import Period
 from qtmodel.time.timeunit import TimeUnit
 from qtmodel.time.weekday import Weekday
 
+# number of days in each month of a common year
+_MONTH_LENGTHS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+# number of days before the first of each month in a common year
+_DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+
+def _is_leap(year: int) -> bool:
+    return year & 3 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _month_length(year: int, month: int) -> int:
+    if month == 2 and _is_leap(year):
+        return 29
+    return _MONTH_LENGTHS[month - 1]
+
+
+def _ordinal(year: int, month: int, day: int) -> int:
+    """ same as date(year, month, day).toordinal(), without building the date """
+    y = year - 1
+    ordinal = y * 365 + y // 4 - y // 100 + y // 400 + _DAYS_BEFORE_MONTH[month - 1] + day
+    if month > 2 and _is_leap(year):
+        ordinal += 1
+    return ordinal
+
+
+def _year_start(year: int) -> int:
+    """
+    :param year:
+    :return: ordinal of January 1st of the given year, without building a date
+    """
+    return _ordinal(year, 1, 1)
+
+
+def _weekday(ordinal: int) -> int:
+    """
+    :param ordinal: day ordinal, as returned by date.toordinal()
+    :return: the weekday of that day, with Monday = 0 as in date.weekday()
+    """
+    # ordinal 1 (January 1st, year 1) was a Monday
+    return (ordinal - 1) % 7
+
 
 class DateTool:
     """
@@ -32,15 +73,10 @@ class DateTool:
                 return date + timedelta(weeks=n)
             elif units == TimeUnit.Months:
                 day = date.day
-                month = date.month + n
-                year = date.year
-                while month > 12:
-                    month -= 12
-                    year += 1
-                while month < 1:
-                    month += 12
-                    year -= 1
-                month_len = calendar.monthrange(year=year, month=month)[1]
+                years, month = divmod(date.month - 1 + n, 12)
+                year = date.year + years
+                month += 1
+                month_len = _month_length(year, month)
                 if day > month_len:
                     day = month_len
                 return datetime(year=year, month=month, day=day)
@@ -48,7 +84,7 @@ class DateTool:
                 day = date.day
                 month = date.month
                 year = date.year + n
-                if day == 29 and month == 2 and not calendar.isleap(year=year):
+                if day == 29 and month == 2 and not _is_leap(year):
                     day = 28
                 return datetime(year=year, month=month, day=day)
             else:
@@ -64,7 +100,7 @@ class DateTool:
         :param date:
         :return:
         """
-        month_len = calendar.monthrange(year=date.year, month=date.month)[1]
+        month_len = _month_length(date.year, date.month)
         this_month_end = datetime(date.year, date.month, month_len)
         return this_month_end
 
@@ -88,16 +124,22 @@ class DateTool:
         :param date:
         :return:
         """
-        return int(date.strftime('%j'))
+        return date.toordinal() - date.replace(month=1, day=1).toordinal() + 1
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def nth_weekday(nth: int, weekday: Weekday, year: int, month: int):
         qt_require(nth > 0, "zeroth day of week in a given (month, year) is undefined")
         qt_require(nth < 6, "no more than 5 weekday in a given (month, year)")
-        first = datetime(year, month, 1).isoweekday()
+        first = _weekday(_ordinal(year, month, 1)) + 1
         skip = nth - (1 if weekday.value >= first else 0)
         return datetime(year, month, (1 + (weekday.value - first) + skip * 7))
 
+    @staticmethod
+    def third_wednesday(year: int, month: int):
+        """ third Wednesday of the given month """
+        return DateTool.nth_weekday(3, Weekday.Wednesday, year, month)
+
     @staticmethod
     def days_between(date1: datetime, date2: datetime):
         return (date2 - date1).days
@@ -16,6 +16,7 @@ class DayCounterTypes(Enum):
 
 
 class DayCounter(metaclass=ABCMeta):
+    __slots__ = ()
 
     @abstractmethod
     def name(self):
@@ -27,7 +28,7 @@ class DayCounter(metaclass=ABCMeta):
         :param date2:
         :return:
         """
-        return (date2 - date1).days
+        return date2.toordinal() - date1.toordinal()
 
     @staticmethod
     @abstractmethod
@@ -1,9 +1,13 @@
 from datetime import datetime
 
+import numpy as np
+
 from qtmodel.time.daycounter import DayCounter
 
 
 class Actual360(DayCounter):
+    __slots__ = ('include_last_day',)
+
     def __init__(self, include_last_day: bool = False):
         self.include_last_day = include_last_day
 
@@ -11,11 +15,26 @@ class Actual360(DayCounter):
         return "Actual/360 (inc)" if self.include_last_day else "Actual/360"
 
     def day_count(self, date1: datetime, date2: datetime):
-        return super().day_count(date1=date1, date2=date2) + (1 if self.include_last_day else 0)
+        return date2.toordinal() - date1.toordinal() + (1 if self.include_last_day else 0)
 
     def year_fraction(self,
                       date1: datetime,
                       date2: datetime,
                       ref_period_start: datetime = None,
                       ref_period_end: datetime = None):
-        return self.day_count(date1=date1, date2=date2) / 360
+        days = date2.toordinal() - date1.toordinal()
+        if self.include_last_day:
+            days += 1
+        return days / 360
+
+    def year_fraction_array(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        :param starts: array of start dates, converted to datetime64[D]
+        :param ends: array of end dates, converted to datetime64[D]
+        :return: year fractions between each pair of dates
+        """
+        days = np.subtract(np.asarray(ends, dtype='datetime64[D]'),
+                           np.asarray(starts, dtype='datetime64[D]')).view(np.int64)
+        if self.include_last_day:
+            days = days + 1
+        return days / 360.0
@@ -1,9 +1,13 @@
 from datetime import datetime
 
+import numpy as np
+
 from qtmodel.time.daycounter import DayCounter
 
 
 class Actual364(DayCounter):
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -15,15 +19,14 @@ class Actual364(DayCounter):
                       date2: datetime,
                       ref_period_start: datetime = None,
                       ref_period_end: datetime = None):
-        return self.day_count(date1=date1, date2=date2)/364
-
-
-
-
-
-
-
-
-
-
-
+        return (date2.toordinal() - date1.toordinal()) / 364
+
+    def year_fraction_array(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        :param starts: array of start dates, converted to datetime64[D]
+        :param ends: array of end dates, converted to datetime64[D]
+        :return: year fractions between each pair of dates
+        """
+        days = np.subtract(np.asarray(ends, dtype='datetime64[D]'),
+                           np.asarray(starts, dtype='datetime64[D]')).view(np.int64)
+        return days / 364.0
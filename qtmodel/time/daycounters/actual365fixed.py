@@ -1,9 +1,40 @@
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+
+import numpy as np
 
 from qtmodel.error import QTError
+from qtmodel.time.date import _DAYS_BEFORE_MONTH
 from qtmodel.time.daycounter import DayCounter
 
+_MONTH_OFFSET = np.array(_DAYS_BEFORE_MONTH, dtype=np.int64)
+
+
+def _no_leap_serial(year: int, month: int, day: int) -> int:
+    """ serial number of a day in a calendar without February 29th """
+    serial = day + _DAYS_BEFORE_MONTH[month - 1] + year * 365
+    # February 29th counts as February 28th
+    if month == 2 and day == 29:
+        serial -= 1
+    return serial
+
+
+@lru_cache(maxsize=4096)
+def _canadian_year_fraction(days_count1: int, days_count2: int) -> float:
+    """
+    :param days_count1: days in the accrual period
+    :param days_count2: days in the reference period
+    :return: Act/365 Canadian year fraction, which depends on the two day counts only
+    """
+    months = round(12 * days_count2 / 365)
+    if months == 0:
+        raise QTError("invalid reference period for Act/365 Canadian must be longer than a month.")
+    frequency = int(12 / months)
+    if days_count1 < int(365 / frequency):
+        return days_count1 / 365
+    return 1 / frequency - (days_count2 - days_count1) / 365
+
 
 class Actual365FixedConventionTypes(Enum):
     Standard = "Actual/365 (Fixed)"
@@ -34,15 +65,8 @@ class Actual365Fixed(DayCounter):
                 raise QTError("invalid ref_period_start")
             if ref_period_end is None:
                 raise QTError("invalid ref_period_end")
-            days_count1 = super().day_count(date1=date1, date2=date2)
-            days_count2 = super().day_count(date1=ref_period_start, date2=ref_period_end)
-            months = round(12 * days_count2 / 365)
-            if months == 0:
-                raise QTError("invalid reference period for Act/365 Canadian must be longer than a month.")
-            frequency = int(12 / months)
-            if days_count1 < int(365 / frequency):
-                return days_count1 / 365
-            return 1 / frequency - (days_count2 - days_count1) / 365
+            return _canadian_year_fraction(date2.toordinal() - date1.toordinal(),
+                                           ref_period_end.toordinal() - ref_period_start.toordinal())
         elif convention == Actual365FixedConventionTypes.NoLeap:
             return self.day_count(date1=date1, date2=date2) / 365.0
         else:
@@ -55,16 +79,30 @@ class Actual365Fixed(DayCounter):
         elif convention == Actual365FixedConventionTypes.Canadian:
             return super().day_count(date1=date1, date2=date2)
         elif convention == Actual365FixedConventionTypes.NoLeap:
-            month_offset = [
-                0, 31, 59, 90, 120, 151,  # Jan - Jun
-                181, 212, 243, 273, 304, 334  # Jun - Dec
-            ]
-            serial_date1 = date1.day + month_offset[date1.month - 1] + date1.year * 365
-            serial_date2 = date2.day + month_offset[date2.month - 1] + date2.year * 365
-            if date1.month == 2 and date1.day == 29:
-                serial_date1 -= 1
-            if date2.month == 2 and date2.day == 29:
-                serial_date2 -= 1
-            return serial_date2 - serial_date1
+            return _no_leap_serial(date2.year, date2.month, date2.day) - \
+                   _no_leap_serial(date1.year, date1.month, date1.day)
         else:
             return QTError("unknown Actual/365 (Fixed) convention")
+
+    def day_count_array(self, dates1: np.ndarray, dates2: np.ndarray) -> np.ndarray:
+        """
+        :param dates1: array of start dates, converted to datetime64[D]
+        :param dates2: array of end dates, converted to datetime64[D]
+        :return: day counts between each pair of dates
+        """
+        dates1 = np.asarray(dates1, dtype='datetime64[D]')
+        dates2 = np.asarray(dates2, dtype='datetime64[D]')
+        if self.convention == Actual365FixedConventionTypes.NoLeap:
+            return self._no_leap_serials(dates2) - self._no_leap_serials(dates1)
+        return (dates2 - dates1).view(np.int64)
+
+    @staticmethod
+    def _no_leap_serials(dates: np.ndarray) -> np.ndarray:
+        months = dates.astype('datetime64[M]')
+        years = dates.astype('datetime64[Y]').view(np.int64) + 1970
+        month_index = months.view(np.int64) % 12
+        days = (dates - months).view(np.int64) + 1
+        serial = days + _MONTH_OFFSET[month_index] + years * 365
+        # February 29th counts as February 28th
+        serial -= (month_index == 1) & (days == 29)
+        return serial
@@ -1,10 +1,11 @@
-import calendar
-import copy
-from datetime import datetime, timedelta
+import bisect
+from datetime import datetime
 from enum import Enum
 
+import numpy as np
+
 from qtmodel.error import qt_require, QTError
-from qtmodel.time.date import DateTool
+from qtmodel.time.date import DateTool, _is_leap, _month_length, _ordinal, _year_start
 from qtmodel.time.daycounter import DayCounter
 from qtmodel.time.schedule import Schedule
 from qtmodel.time.timeunit import TimeUnit
@@ -39,6 +40,21 @@ class ActualActual(DayCounter):
                  schedule: Schedule = None):
         self.convention = convention
         self.schedule = schedule
+        year_fraction_impl = ActualActual._DISPATCH.get(convention)
+        if year_fraction_impl is None:
+            raise QTError("unknown act/act convention")
+        # the method of the convention, bound once instead of dispatched per call
+        self._year_fraction_impl = year_fraction_impl.__get__(self)
+        # reference period ordinals -> reference day count times coupons per year
+        self._reference_cache = {}
+        # coupon dates of the schedule, quasi-payments included, and their
+        # day ordinals; built on first use for the schedule they were taken from
+        self._coupon_schedule = None
+        self._coupon_dates = None
+        self._coupon_ordinals = None
+        # per coupon period, reference day count times coupons per year as used
+        # by the array version of the ISMA convention, NaN for short periods
+        self._coupon_denominators = None
 
     def name(self):
         return self.convention.value
@@ -48,53 +64,94 @@ class ActualActual(DayCounter):
                       date2: datetime,
                       ref_period_start: datetime = None,
                       ref_period_end: datetime = None):
-        convention = self.convention
-        if convention == ActualActualConventionTypes.ISMA or convention == ActualActualConventionTypes.Bond:
-            if self.schedule is not None and not self.schedule.empty():
-                return self.year_fraction_isma(date1, date2, ref_period_start, ref_period_end)
-            else:
-                return self.year_fraction_old_isma(date1, date2, ref_period_start, ref_period_end)
-        elif convention == ActualActualConventionTypes.ISDA or \
-                convention == ActualActualConventionTypes.Historical or \
-                convention == ActualActualConventionTypes.Actual365:
-            return self.year_fraction_isda(date1, date2)
-        elif convention == ActualActualConventionTypes.AFB or \
-                convention == ActualActualConventionTypes.Euro:
-            return self.year_fraction_afb(date1, date2)
+        return self._year_fraction_impl(date1, date2, ref_period_start, ref_period_end)
+
+    def _year_fraction_bond(self,
+                            date1: datetime,
+                            date2: datetime,
+                            ref_period_start: datetime = None,
+                            ref_period_end: datetime = None):
+        if self.schedule is not None and not self.schedule.empty():
+            return self.year_fraction_isma(date1, date2, ref_period_start, ref_period_end)
         else:
-            raise QTError("unknown act/act convention")
+            return self.year_fraction_old_isma(date1, date2, ref_period_start, ref_period_end)
 
     def year_fraction_isma(self,
                            date1: datetime,
                            date2: datetime,
                            ref_period_start: datetime = None,
                            ref_period_end: datetime = None):
-        if date1 == date2:
+        ordinal1 = date1.toordinal()
+        ordinal2 = date2.toordinal()
+        if ordinal1 == ordinal2:
             return 0.0
-        elif date2 < date1:
+        elif ordinal2 < ordinal1:
             return -self.year_fraction(date2, date1, ref_period_start, ref_period_end)
-        coupon_dates = self.get_list_of_period_dates_including_quasi_payments(self.schedule)
-
-        first_date = min(coupon_dates)
-        last_date = max(coupon_dates)
-
-        qt_require(date1 >= first_date and date2 <= last_date,
-                   f"Dates out of range of schedule: date 1: {date1}, date 2: {date2}, first date: {first_date}, last date: {last_date}")
-
+        self._update_coupon_dates()
+        coupon_dates = self._coupon_dates
+        coupon_ordinals = self._coupon_ordinals
+
+        # coupon dates are sorted, quasi-payments included
+        qt_require(ordinal1 >= coupon_ordinals[0] and ordinal2 <= coupon_ordinals[-1],
+                   f"Dates out of range of schedule: date 1: {date1}, date 2: {date2}, "
+                   f"first date: {coupon_dates[0]}, last date: {coupon_dates[-1]}")
+
+        # only the periods from the one containing date1 to the one
+        # containing date2 overlap [date1, date2]
+        lo = max(bisect.bisect_right(coupon_ordinals, ordinal1) - 1, 0)
+        hi = min(bisect.bisect_left(coupon_ordinals, ordinal2), len(coupon_ordinals) - 1)
         year_fraction_sum = 0.0
-        i = 0
-        while i < len(coupon_dates) - 1:
-            start_reference_period = coupon_dates[i]
-            end_reference_period = coupon_dates[i + 1]
-            if date1 < end_reference_period and date2 > start_reference_period:
-                year_fraction_sum += self.year_fraction_with_reference_dates(
-                    max(date1, start_reference_period),
-                    min(date2, end_reference_period),
-                    start_reference_period,
-                    end_reference_period)
-            i += 1
+        for i in range(lo, hi):
+            start_ordinal = coupon_ordinals[i]
+            end_ordinal = coupon_ordinals[i + 1]
+            year_fraction_sum += self._year_fraction_with_reference_ordinals(
+                max(ordinal1, start_ordinal),
+                min(ordinal2, end_ordinal),
+                start_ordinal,
+                end_ordinal)
         return year_fraction_sum
 
+    def year_fraction_isma_array(self, dates1: np.ndarray, dates2: np.ndarray) -> np.ndarray:
+        """
+        :param dates1: array of start dates, converted to datetime64[D]
+        :param dates2: array of end dates, converted to datetime64[D]
+        :return: year fractions between each pair of dates under the ISMA
+                 convention, taken from the coupon periods of the schedule
+        """
+        qt_require(self.schedule is not None and not self.schedule.empty(),
+                   "a schedule is required for ISMA year fractions over arrays")
+        self._update_coupon_dates()
+        coupons = np.array(self._coupon_ordinals, dtype=np.int64)
+        if self._coupon_denominators is None:
+            lengths = np.diff(coupons)
+            months = np.maximum(np.round(12 * lengths / 365.0), 1.0)
+            self._coupon_denominators = np.where(lengths >= 16, lengths * np.round(12.0 / months), np.nan)
+        epoch = _year_start(1970)
+        ordinals1 = np.asarray(dates1, dtype='datetime64[D]').view(np.int64) + epoch
+        ordinals2 = np.asarray(dates2, dtype='datetime64[D]').view(np.int64) + epoch
+        # coupon period containing each date, so that pairs lying in a single
+        # period are a plain division; any other pair goes the scalar way
+        periods1 = np.searchsorted(coupons, ordinals1, side='right') - 1
+        periods2 = np.searchsorted(coupons, ordinals2, side='left') - 1
+        single = (periods1 == periods2) & (ordinals1 < ordinals2) & \
+                 (periods1 >= 0) & (periods1 < len(coupons) - 1)
+        denominators = self._coupon_denominators[np.where(single, periods1, 0)]
+        single &= ~np.isnan(denominators)
+        result = np.empty(ordinals1.shape, dtype=np.float64)
+        result[single] = (ordinals2 - ordinals1)[single] / denominators[single]
+        for i in np.flatnonzero(~single).tolist():
+            result[i] = self.year_fraction_isma(datetime.fromordinal(int(ordinals1[i])),
+                                                datetime.fromordinal(int(ordinals2[i])))
+        return result
+
+    def _update_coupon_dates(self):
+        """ take the coupon dates, quasi-payments included, from the current schedule """
+        if self._coupon_schedule is not self.schedule:
+            self._coupon_dates = self.get_list_of_period_dates_including_quasi_payments(self.schedule)
+            self._coupon_ordinals = [d.toordinal() for d in self._coupon_dates]
+            self._coupon_denominators = None
+            self._coupon_schedule = self.schedule
+
     def year_fraction_old_isma(self,
                                date1: datetime,
                                date2: datetime,
@@ -119,7 +176,7 @@ class ActualActual(DayCounter):
                    reference period end: {ref_period_end}''')
 
         # estimate roughly the length in months of a period
-        months = round(12 * (ref_period_end - ref_period_start).days / 365)
+        months = round(12 * (ref_period_end.toordinal() - ref_period_start.toordinal()) / 365)
 
         # for short periods...
         if months == 0:
@@ -139,8 +196,8 @@ class ActualActual(DayCounter):
                 # [maybe the equality should be enforced, since
                 # ref_period_start < date1 <= date2 < ref_period_end
                 # could give wrong results] ???
-                return period * DateTool.days_between(date1, date2) / DateTool.days_between(ref_period_start,
-                                                                                            ref_period_end)
+                return period * (date2.toordinal() - date1.toordinal()) / \
+                    (ref_period_end.toordinal() - ref_period_start.toordinal())
             else:
                 # here ref_period_start is the next (maybe notional)
                 # payment date and ref_period_end is the second next
@@ -179,21 +236,31 @@ class ActualActual(DayCounter):
             # the part from ref_period_end to date2
             # count how many regular periods are in [ref_period_end, date2],
             # then add the remaining time
+            # each period end is ref_period_end moved by whole months, with
+            # its day capped at the month length as DateTool.advance does
+            base_year = ref_period_end.year
+            base_month = ref_period_end.month - 1
+            base_day = ref_period_end.day
+            new_ref_start = datetime(base_year, base_month + 1, base_day)
             i = 0
             while 1:
-                new_ref_start = DateTool.advance(date=ref_period_end, n=months * i, units=TimeUnit.Months)
-                new_ref_end = DateTool.advance(date=ref_period_end, n=months * (i + 1), units=TimeUnit.Months)
+                years, month = divmod(base_month + months * (i + 1), 12)
+                year = base_year + years
+                new_ref_end = datetime(year, month + 1, min(base_day, _month_length(year, month + 1)))
                 if date2 < new_ref_end:
                     break
                 else:
                     sum_ += period
                     i += 1
+                    new_ref_start = new_ref_end
             sum_ += self.year_fraction(new_ref_start, date2, new_ref_start, new_ref_end)
             return sum_
 
     def year_fraction_isda(self,
                            date1: datetime,
-                           date2: datetime):
+                           date2: datetime,
+                           ref_period_start: datetime = None,
+                           ref_period_end: datetime = None):
         if date1 == date2:
             return 0.0
 
@@ -202,46 +269,67 @@ class ActualActual(DayCounter):
 
         year1 = date1.year
         year2 = date2.year
-        total_days_in_year1 = 366 if calendar.isleap(year1) else 365
-        total_days_in_year2 = 366 if calendar.isleap(year2) else 365
+        total_days_in_year1 = 366 if _is_leap(year1) else 365
+        total_days_in_year2 = 366 if _is_leap(year2) else 365
         sum_ = year2 - year1 - 1
         # FLOATING_POINT_EXCEPTION
-        sum_ += DateTool.days_between(date1, datetime(year1+1, 1, 1)) / total_days_in_year1
-        sum_ += DateTool.days_between(datetime(year2, 1, 1), date2) / total_days_in_year2
+        sum_ += (_year_start(year1 + 1) - date1.toordinal()) / total_days_in_year1
+        sum_ += (date2.toordinal() - _year_start(year2)) / total_days_in_year2
         return sum_
 
     def year_fraction_afb(self,
                           date1: datetime,
-                          date2: datetime):
+                          date2: datetime,
+                          ref_period_start: datetime = None,
+                          ref_period_end: datetime = None):
         if date1 == date2:
             return 0.0
 
         if date1 > date2:
             return -self.year_fraction(date2, date1, None, None)
 
-        new_date2 = date2
-        temp = date2
-        sum_ = 0.0
-        while temp > date1:
-            temp = DateTool.advance(date=new_date2, n=-1, units=TimeUnit.Years)
-            if temp.day == 28 and temp.month == 2 and calendar.isleap(temp.year):
-                temp += timedelta(days=1)
-            if temp >= date1:
-                sum_ += 1.0
-                new_date2 = temp
-
+        # count the whole years back from date2 in one step; at most one
+        # year too many is taken when date2 falls earlier in its year than date1
+        years = date2.year - date1.year
+        new_date2 = self._years_before(date2, years)
+        if new_date2 < date1:
+            years -= 1
+            new_date2 = self._years_before(date2, years)
+        sum_ = float(years)
+
+        ordinal1 = date1.toordinal()
+        ordinal2 = new_date2.toordinal()
         den = 365.0
 
-        if calendar.isleap(new_date2.year):
-            temp = datetime(new_date2.year, 2, 29)
-            if new_date2 > temp >= date1:
+        # one more day when February 29th lies in [date1, new_date2)
+        if _is_leap(new_date2.year):
+            if ordinal2 > _ordinal(new_date2.year, 2, 29) >= ordinal1:
                 den += 1.0
-        elif calendar.isleap(date1.year):
-            temp = datetime(date1.year, 2, 29)
-            if new_date2 > temp >= date1:
+        elif _is_leap(date1.year):
+            if ordinal2 > _ordinal(date1.year, 2, 29) >= ordinal1:
                 den += 1.0
 
-        return sum_ + DateTool.days_between(date1, new_date2) / den
+        return sum_ + (ordinal2 - ordinal1) / den
+
+    @staticmethod
+    def _years_before(date: datetime, n: int):
+        """ date moved n years back, end of February being kept at the end of February """
+        if n == 0:
+            return date
+        year = date.year - n
+        if date.month == 2 and date.day >= 28:
+            return date.replace(year=year, day=29 if _is_leap(year) else 28)
+        return date.replace(year=year)
+
+    _DISPATCH = {
+        ActualActualConventionTypes.ISMA: _year_fraction_bond,
+        ActualActualConventionTypes.Bond: _year_fraction_bond,
+        ActualActualConventionTypes.ISDA: year_fraction_isda,
+        ActualActualConventionTypes.Historical: year_fraction_isda,
+        ActualActualConventionTypes.Actual365: year_fraction_isda,
+        ActualActualConventionTypes.AFB: year_fraction_afb,
+        ActualActualConventionTypes.Euro: year_fraction_afb,
+    }
 
     def find_coupons_per_year(self,
                               ref_start: datetime,
@@ -260,7 +348,8 @@ class ActualActual(DayCounter):
     def get_list_of_period_dates_including_quasi_payments(schedule: Schedule):
         # Process the schedule into an array of dates.
         issue_date = schedule[0]
-        new_dates = copy.deepcopy(schedule.dates)
+        # the dates themselves are immutable, so a shallow copy of the list will do
+        new_dates = list(schedule.dates)
         if not schedule.has_is_regular() or not schedule.is_regular(i=1):
             first_coupon = schedule[1]
             notional_first_coupon = schedule.calendar.advance(date=first_coupon,
@@ -299,13 +388,26 @@ class ActualActual(DayCounter):
                                            date3: datetime,
                                            date4: datetime):
         qt_require(date1 <= date2, f"This function is only correct if date1 <= date2\ndate1: {date1} date2: {date2}")
-
-        reference_day_count = self.day_count(date1=date3, date2=date4)
-        # guess how many coupon periods per year:
-        if reference_day_count < 16:
-            coupons_per_year = 1
-            reference_day_count = self.day_count(date1=date1,
-                                                 date2=DateTool.advance(date=date1, n=1, units=TimeUnit.Years))
-        else:
-            coupons_per_year = self.find_coupons_per_year(ref_start=date3, ref_end=date4)
-        return self.day_count(date1=date1, date2=date2) / (reference_day_count * coupons_per_year)
+        return self._year_fraction_with_reference_ordinals(date1.toordinal(), date2.toordinal(),
+                                                           date3.toordinal(), date4.toordinal())
+
+    def _year_fraction_with_reference_ordinals(self,
+                                               ordinal1: int,
+                                               ordinal2: int,
+                                               ordinal3: int,
+                                               ordinal4: int):
+        """ year_fraction_with_reference_dates on day ordinals, date1 <= date2 being assumed """
+        reference = self._reference_cache.get((ordinal3, ordinal4))
+        if reference is None:
+            reference_day_count = ordinal4 - ordinal3
+            # guess how many coupon periods per year:
+            if reference_day_count < 16:
+                # the reference period is one year from date1, which is not cached
+                date1 = datetime.fromordinal(ordinal1)
+                reference_day_count = DateTool.advance(date=date1, n=1, units=TimeUnit.Years).toordinal() - ordinal1
+                return (ordinal2 - ordinal1) / reference_day_count
+            # This will only work for day counts longer than 15 days.
+            months = round(12 * reference_day_count / 365.0)
+            coupons_per_year = round(12.0 / months)
+            reference = self._reference_cache[(ordinal3, ordinal4)] = reference_day_count * coupons_per_year
+        return (ordinal2 - ordinal1) / reference
@@ -20,4 +20,4 @@ class OneDayCounter(DayCounter):
                       date2: datetime,
                       ref_period_start: datetime = None,
                       ref_period_end: datetime = None):
-        return self.day_count(date1=date1, date2=date2)
+        return 1 if date2 >= date1 else -1
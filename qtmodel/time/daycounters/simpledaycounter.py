@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from qtmodel.time.date import DateTool
+from qtmodel.time.date import _month_length
 from qtmodel.time.daycounter import DayCounter
 from qtmodel.time.daycounters.thirty360 import Thirty360, Thirty360ConventionTypes
 
@@ -34,13 +34,16 @@ class SimpleDayCounter(DayCounter):
         day1 = date1.day
         day2 = date2.day
 
-        if (day1 == day2 or
-                # e.g., Aug 30 -> Feb 28 ?
-                (day1 > day2 and DateTool.is_end_of_month(date2)) or
-                # e.g., Feb 28 -> Aug 30 ?
-                (day1 < day2 and DateTool.is_end_of_month(date1))):
+        if day1 == day2:
+            whole_months = True
+        elif day1 > day2:
+            # e.g., Aug 30 -> Feb 28 ?
+            whole_months = day2 == _month_length(date2.year, date2.month)
+        else:
+            # e.g., Feb 28 -> Aug 30 ?
+            whole_months = day1 == _month_length(date1.year, date1.month)
 
+        if whole_months:
             return date2.year - date1.year + (date2.month - date1.month) / 12.0
-
         else:
             return self.fallback.year_fraction(date1, date2)
@@ -1,11 +1,32 @@
-import calendar
 from datetime import datetime
 from enum import Enum
 
+import numpy as np
+
 from qtmodel.error import QTError
+from qtmodel.time.date import _is_leap
 from qtmodel.time.daycounter import DayCounter
 
 
+def _is_last_of_february(year: int, month: int, day: int) -> bool:
+    return month == 2 and day == (29 if _is_leap(year) else 28)
+
+
+def _year_month_day(dates: np.ndarray):
+    """
+    :param dates: array of datetime64[D] dates
+    :return: arrays of the years, months and days of month of the dates
+    """
+    months = dates.astype('datetime64[M]')
+    years = dates.astype('datetime64[Y]').view(np.int64) + 1970
+    return years, months.view(np.int64) % 12 + 1, (dates - months).view(np.int64) + 1
+
+
+def _is_last_of_february_array(years: np.ndarray, months: np.ndarray, days: np.ndarray) -> np.ndarray:
+    leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    return (months == 2) & (days == 28 + leap)
+
+
 class Thirty360ConventionTypes(Enum):
     USA = "30/360 (US)"
     BondBasis = "30/360 (Bond Basis)"
@@ -26,28 +47,17 @@ class Thirty360(DayCounter):
         self.convention = convention
         self.termination_date = termination_date
         self.is_last_period = is_last_period
+        day_count_impl = Thirty360._DISPATCH.get(convention)
+        if day_count_impl is None:
+            raise QTError("unknown 30/360 convention")
+        # the rule of the convention, bound once instead of dispatched per call
+        self._day_count_impl = day_count_impl.__get__(self)
 
     def name(self):
         return self.convention.value
 
     def day_count(self, date1: datetime, date2: datetime):
-        if self.convention == Thirty360ConventionTypes.USA:
-            return self.day_count_us(date1, date2)
-        elif self.convention == Thirty360ConventionTypes.European or \
-                self.convention == Thirty360ConventionTypes.EurobondBasis:
-            return self.day_count_eu(date1, date2)
-        elif self.convention == Thirty360ConventionTypes.Italian:
-            return self.day_count_it(date1, date2)
-        elif self.convention == Thirty360ConventionTypes.ISMA or \
-                self.convention == Thirty360ConventionTypes.BondBasis:
-            return self.day_count_isma(date1, date2)
-        elif self.convention == Thirty360ConventionTypes.ISDA or \
-                self.convention == Thirty360ConventionTypes.German:
-            return self.day_count_isda(date1, date2)
-        elif self.convention == Thirty360ConventionTypes.NASD:
-            return self.day_count_nasd(date1, date2)
-        else:
-            raise QTError("unknown 30/360 convention")
+        return self._day_count_impl(date1, date2)
 
     def day_count_us(self, date1: datetime, date2: datetime):
         day1 = date1.day
@@ -62,9 +72,9 @@ class Thirty360(DayCounter):
         if day2 == 31 and day1 >= 30:
             day2 = 30
 
-        if self.is_last_of_february(year2, month2, day2) and self.is_last_of_february(year1, month1, day1):
-            day2 = 30
-        if self.is_last_of_february(year1, month1, day1):
+        if _is_last_of_february(year1, month1, day1):
+            if _is_last_of_february(year2, month2, day2):
+                day2 = 30
             day1 = 30
 
         return 360 * (year2 - year1) + 30 * (month2 - month1) + (day2 - day1)
@@ -132,12 +142,15 @@ class Thirty360(DayCounter):
         if day2 == 31:
             day2 = 30
 
-        if self.is_last_of_february(year1, month1, day1):
+        if _is_last_of_february(year1, month1, day1):
             day1 = 30
 
-        is_termination_date = self.is_last_period if self.termination_date is None else date2 == self.termination_date
-        if not is_termination_date and self.is_last_of_february(year2, month2, day2):
-            day2 = 30
+        # the termination test is only needed when date2 is at the end of February
+        if _is_last_of_february(year2, month2, day2):
+            is_termination_date = self.is_last_period if self.termination_date is None \
+                else date2 == self.termination_date
+            if not is_termination_date:
+                day2 = 30
 
         return 360 * (year2 - year1) + 30 * (month2 - month1) + (day2 - day1)
 
@@ -159,15 +172,76 @@ class Thirty360(DayCounter):
 
         return 360 * (year2 - year1) + 30 * (month2 - month1) + (day2 - day1)
 
+    _DISPATCH = {
+        Thirty360ConventionTypes.USA: day_count_us,
+        Thirty360ConventionTypes.BondBasis: day_count_isma,
+        Thirty360ConventionTypes.European: day_count_eu,
+        Thirty360ConventionTypes.EurobondBasis: day_count_eu,
+        Thirty360ConventionTypes.Italian: day_count_it,
+        Thirty360ConventionTypes.German: day_count_isda,
+        Thirty360ConventionTypes.ISMA: day_count_isma,
+        Thirty360ConventionTypes.ISDA: day_count_isda,
+        Thirty360ConventionTypes.NASD: day_count_nasd,
+    }
+
+    def day_count_array(self, dates1: np.ndarray, dates2: np.ndarray) -> np.ndarray:
+        """
+        :param dates1: array of start dates, converted to datetime64[D]
+        :param dates2: array of end dates, converted to datetime64[D]
+        :return: day counts between each pair of dates, under the same rules as day_count
+        """
+        dates1 = np.asarray(dates1, dtype='datetime64[D]')
+        dates2 = np.asarray(dates2, dtype='datetime64[D]')
+        year1, month1, day1 = _year_month_day(dates1)
+        year2, month2, day2 = _year_month_day(dates2)
+
+        convention = self.convention
+        if convention == Thirty360ConventionTypes.USA:
+            last_of_february1 = _is_last_of_february_array(year1, month1, day1)
+            last_of_february2 = _is_last_of_february_array(year2, month2, day2)
+            day1 = np.minimum(day1, 30)
+            day2 = np.where(((day2 == 31) & (day1 >= 30)) | (last_of_february1 & last_of_february2), 30, day2)
+            day1 = np.where(last_of_february1, 30, day1)
+        elif convention == Thirty360ConventionTypes.European or \
+                convention == Thirty360ConventionTypes.EurobondBasis:
+            day1 = np.minimum(day1, 30)
+            day2 = np.minimum(day2, 30)
+        elif convention == Thirty360ConventionTypes.Italian:
+            day1 = np.where((month1 == 2) & (day1 > 27), 30, np.minimum(day1, 30))
+            day2 = np.where((month2 == 2) & (day2 > 27), 30, np.minimum(day2, 30))
+        elif convention == Thirty360ConventionTypes.ISMA or \
+                convention == Thirty360ConventionTypes.BondBasis:
+            day1 = np.minimum(day1, 30)
+            day2 = np.where((day2 == 31) & (day1 == 30), 30, day2)
+        elif convention == Thirty360ConventionTypes.ISDA or \
+                convention == Thirty360ConventionTypes.German:
+            if self.termination_date is None:
+                is_termination_date = self.is_last_period
+            else:
+                is_termination_date = dates2 == np.datetime64(self.termination_date, 'D')
+            day1 = np.where(_is_last_of_february_array(year1, month1, day1), 30, np.minimum(day1, 30))
+            day2 = np.where(np.logical_not(is_termination_date) & _is_last_of_february_array(year2, month2, day2),
+                            30, np.minimum(day2, 30))
+        elif convention == Thirty360ConventionTypes.NASD:
+            day1 = np.minimum(day1, 30)
+            # a 31st is moved to the 1st of the next month unless day1 is a 30th
+            next_month = (day2 == 31) & (day1 < 30)
+            day2 = np.where(next_month, 1, np.minimum(day2, 30))
+            month2 = month2 + next_month
+        else:
+            raise QTError("unknown 30/360 convention")
+
+        return 360 * (year2 - year1) + 30 * (month2 - month1) + (day2 - day1)
+
     def year_fraction(self,
                       date1: datetime,
                       date2: datetime,
                       ref_period_start: datetime = None,
                       ref_period_end: datetime = None):
-        return self.day_count(date1=date1, date2=date2) / 360.0
+        return self._day_count_impl(date1, date2) / 360.0
 
     @staticmethod
     def is_last_of_february(year: int,
                             month: int,
                             day: int):
-        return month == 2 and day == 28 + (1 if calendar.isleap(year) else 0)
+        return _is_last_of_february(year, month, day)
@@ -196,7 +196,7 @@ class IMM:
                     month = skip_months - 12
                     year += 1
 
-            result = DateTool.nth_weekday(nth=3, weekday=Weekday.Wednesday, year=year, month=month)
+            result = DateTool.third_wednesday(year, month)
             if result <= ref_date:
                 result = IMM.next_date(date=datetime(year, month, 22), main_cycle=main_cycle)
             return result
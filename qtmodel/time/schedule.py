@@ -14,7 +14,13 @@ from qtmodel.time.frequency import Frequency
 from qtmodel.time.imm import IMM
 from qtmodel.time.period import Period
 from qtmodel.time.timeunit import TimeUnit
-from qtmodel.time.weekday import Weekday
+
+# rules whose dates are rolled onto the twentieth of a main IMM month
+_TWENTIETH_IMM_RULES = frozenset((DateGenerationTypes.Twentieth_IMM,
+                                  DateGenerationTypes.Old_CDS,
+                                  DateGenerationTypes.CDS,
+                                  DateGenerationTypes.CDS2015))
+_IMM_MONTHS = frozenset((3, 6, 9, 12))
 
 
 class Schedule:
@@ -184,13 +190,11 @@ class Schedule:
                 i = 1
                 length = len(self.dates)
                 while i < length - 1:
-                    self.dates[i] = DateTool.nth_weekday(nth=3, weekday=Weekday.Wednesday, year=self.dates[i].year,
-                                                         month=self.dates[i].month)
+                    self.dates[i] = DateTool.third_wednesday(self.dates[i].year, self.dates[i].month)
                     i += 1
             elif self.rule_ == DateGenerationTypes.Third_Wednesday_Inclusive:
                 for i in range(len(self.dates)):
-                    self.dates[i] = DateTool.nth_weekday(nth=3, weekday=Weekday.Wednesday, year=self.dates[i].year,
-                                                         month=self.dates[i].month)
+                    self.dates[i] = DateTool.third_wednesday(self.dates[i].year, self.dates[i].month)
 
             if self.end_of_month_ and self.calendar.is_end_of_month(date=self.seed):
                 # adjust to end of month
@@ -349,12 +353,9 @@ class Schedule:
         result = datetime(date.year, date.month, 20)
         if result < date:
             result = DateTool.advance(date=result, n=1, units=TimeUnit.Months)
-        if rule == DateGenerationTypes.Twentieth_IMM or \
-                rule == DateGenerationTypes.Old_CDS or \
-                rule == DateGenerationTypes.CDS or \
-                rule == DateGenerationTypes.CDS2015:
+        if rule in _TWENTIETH_IMM_RULES:
             month = result.month
-            if month % 3 != 0:
+            if month not in _IMM_MONTHS:
                 # not a main IMM nmonth
                 skip = 3 - month % 3
                 result = DateTool.advance(date=result, n=skip, units=TimeUnit.Months)
@@ -370,12 +371,9 @@ class Schedule:
         result = datetime(date.year, date.month, 20)
         if result > date:
             result = DateTool.advance(date=result, n=-1, units=TimeUnit.Months)
-        if rule == DateGenerationTypes.Twentieth_IMM or \
-                rule == DateGenerationTypes.Old_CDS or \
-                rule == DateGenerationTypes.CDS or \
-                rule == DateGenerationTypes.CDS2015:
+        if rule in _TWENTIETH_IMM_RULES:
             month = result.month
-            if month % 3 != 0:
+            if month not in _IMM_MONTHS:
                 # not a main IMM nmonth
                 skip = month % 3
                 result = DateTool.advance(date=result, n=-skip, units=TimeUnit.Months)
@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from qtmodel.error import TestError, qt_require
 from qtmodel.settings import Settings
 from qtmodel.time.calendar import CalendarTypes
@@ -11,6 +13,7 @@ from qtmodel.time.calendars.china import China
 from qtmodel.time.calendars.target import TARGET
 from qtmodel.time.calendars.unitedstates import UnitedStates
 from qtmodel.time.calendars.brazil import Brazil
+from qtmodel.time.calendars.japan import Japan
 from qtmodel.time.calendars.bespokecalendar import BespokeCalendar
 from qtmodel.time.weekday import Weekday
 
@@ -34,10 +37,10 @@ def test_modified_calendars():
     # test
     added_holidays = set(calendar1.added_holidays)
     removed_holidays = set(calendar1.removed_holidays)
-    qt_require(date1 not in added_holidays, "did not expect to find date in added_holidays")
-    qt_require(date2 in added_holidays, "expected to find date in added_holidays")
-    qt_require(date1 in removed_holidays, "expected to find date in removed_holidays")
-    qt_require(date2 not in removed_holidays, "did not expect to find date in removed_holidays")
+    qt_require(date1.toordinal() not in added_holidays, "did not expect to find date in added_holidays")
+    qt_require(date2.toordinal() in added_holidays, "expected to find date in added_holidays")
+    qt_require(date1.toordinal() in removed_holidays, "expected to find date in removed_holidays")
+    qt_require(date2.toordinal() not in removed_holidays, "did not expect to find date in removed_holidays")
 
     if calendar1.is_holiday(date1):
         raise TestError(f"{date1} still a holiday for original TARGET instance")
@@ -395,6 +398,41 @@ def test_Brazil():
         raise TestError(
             f"there were {len(expected_hol)} expected holidays, while there are {len(hol)} calculated holidays")
 
+def test_Japan():
+    print("Testing Japan holiday list...")
+
+    # expectedHol.push_back(Date(1,January,2023)); // Sunday
+    expected_hol = [datetime(2023, 1, 2)]
+    expected_hol.append(datetime(2023, 1, 3))
+    expected_hol.append(datetime(2023, 1, 9))
+    expected_hol.append(datetime(2023, 2, 23))
+    # Vernal Equinox
+    expected_hol.append(datetime(2023, 3, 21))
+    # expectedHol.push_back(Date(29,April,2023)); // Saturday
+    expected_hol.append(datetime(2023, 5, 3))
+    expected_hol.append(datetime(2023, 5, 4))
+    expected_hol.append(datetime(2023, 5, 5))
+    expected_hol.append(datetime(2023, 7, 17))
+    expected_hol.append(datetime(2023, 8, 11))
+    expected_hol.append(datetime(2023, 9, 18))
+    # expectedHol.push_back(Date(23,September,2023)); // Saturday
+    expected_hol.append(datetime(2023, 10, 9))
+    expected_hol.append(datetime(2023, 11, 3))
+    expected_hol.append(datetime(2023, 11, 23))
+    # expectedHol.push_back(Date(31,December,2023)); // Sunday
+
+    calendar = Japan()
+    hol = calendar.holiday_list(datetime(2023, 1, 1), datetime(2023, 12, 31))
+
+    for i in range(0, min(len(hol), len(expected_hol))):
+        if hol[i] != expected_hol[i]:
+            raise TestError(
+                f"expected holiday was {expected_hol[i]} while calculated holiday is {hol[i]}")
+
+    if len(hol) != len(expected_hol):
+        raise TestError(
+            f"there were {len(expected_hol)} expected holidays, while there are {len(hol)} calculated holidays")
+
 def test_China_SSE():
     print("Testing China Shanghai Stock Exchange holiday list...")
 
@@ -859,6 +897,17 @@ def test_bespoke_calendars():
     if a2.is_business_day(test_date4):
         raise TestError(f"{test_date4} (marked as holiday) not detected")
 
+    # distinct calendars sharing a name must all be joined
+    c1 = BespokeCalendar()
+    c1.add_weekend(Weekday.Saturday)
+    c2 = BespokeCalendar()
+    c2.add_weekend(Weekday.Sunday)
+    joint = JointCalendar([c1, c2], JointCalendarRule.JoinHolidays)
+    if joint.is_business_day(test_date1):
+        raise TestError(f"{test_date1} (Saturday) not detected as weekend in joint calendar.")
+    if joint.is_business_day(test_date2):
+        raise TestError(f"{test_date2} (Sunday) not detected as weekend in joint calendar.")
+
 
 def test_day_lists():
     print("Testing holidayList and businessDaysList...")
@@ -900,3 +949,26 @@ def test_day_lists():
         else:
             raise TestError(f"Date {it_date} is neither holiday nor business day.")
         it_date += one_day
+
+
+def test_business_day_masks():
+    print("Testing vectorized business-day checks...")
+    calendars = [TARGET(), Japan(), Brazil(),
+                 JointCalendar([TARGET(), Japan()], JointCalendarRule.JoinHolidays),
+                 JointCalendar([TARGET(), Japan()], JointCalendarRule.JoinBusinessDays)]
+    first_date = datetime(2018, 12, 1)
+    end_date = datetime(2021, 1, 31)
+    one_day = timedelta(days=1)
+    for calendar in calendars:
+        business_days = calendar.is_business_days(first_date, end_date)
+        it_date = first_date
+        for is_business_day in business_days:
+            if is_business_day != calendar.is_business_day(it_date):
+                raise TestError(f"wrong business-day flag for {it_date} in {calendar.name()} calendar")
+            it_date += one_day
+        if it_date != end_date + one_day:
+            raise TestError(f"{len(business_days)} business-day flags returned "
+                            f"between {first_date} and {end_date}")
+        dates = np.arange(np.datetime64(first_date, 'D'), np.datetime64(end_date, 'D'), 7)
+        if not (calendar.is_business_day_array(dates) == business_days[::7]).all():
+            raise TestError(f"wrong business-day flags for a date array in {calendar.name()} calendar")
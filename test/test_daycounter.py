@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 from typing import List
+import numpy as np
 from loguru import logger
 
 from qtmodel.error import TestError, qt_require, QTError, NotCatchError
@@ -13,6 +14,8 @@ from qtmodel.time.daycounters import *
 from qtmodel.time.businessdayconvention import BusinessDayConvention
 from qtmodel.time.calendars.nullcalendar import NullCalendar
 from qtmodel.time.dategenerationrule import DateGenerationTypes
+from qtmodel.time.daycounters.actual360 import Actual360
+from qtmodel.time.daycounters.actual364 import Actual364
 from qtmodel.time.daycounters.actual365fixed import Actual365Fixed, Actual365FixedConventionTypes
 from qtmodel.time.daycounters.actualactual import ActualActualConventionTypes, ActualActual
 from qtmodel.time.daycounters.business252 import Business252
@@ -738,3 +741,67 @@ def test_actual_actual_out_of_schedule_range():
         raised = True
     if not raised:
         raise QTError("Exception expected but did not happen!")
+
+
+def test_actual_360_364_arrays():
+    print("Testing vectorized Actual/360 and Actual/364 year fractions...")
+    starts = [datetime(2002, 1, 1) + timedelta(days=17 * i) for i in range(100)]
+    ends = [DateTool.advance(date=d, period=Period(7, TimeUnit.Months)) for d in starts]
+    for day_counter in [Actual360(), Actual360(True), Actual364()]:
+        calculated = day_counter.year_fraction_array(np.array(starts, dtype='datetime64[D]'),
+                                                     np.array(ends, dtype='datetime64[D]'))
+        for i in range(len(starts)):
+            expected = day_counter.year_fraction(starts[i], ends[i])
+            if calculated[i] != expected:
+                raise QTError(f"{day_counter.name()} from {starts[i]} to {ends[i]}\n"
+                              f" calculated: {calculated[i]}\n expected: {expected}")
+
+
+def test_actual_365_no_leap_arrays():
+    print("Testing vectorized Actual/365 (No Leap) day counts...")
+    day_counter = Actual365Fixed(Actual365FixedConventionTypes.NoLeap)
+    starts = [datetime(1999, 12, 1) + timedelta(days=11 * i) for i in range(400)]
+    ends = [d + timedelta(days=(37 * i) % 800) for i, d in enumerate(starts)]
+    calculated = day_counter.day_count_array(np.array(starts, dtype='datetime64[D]'),
+                                             np.array(ends, dtype='datetime64[D]'))
+    for i in range(len(starts)):
+        expected = day_counter.day_count(starts[i], ends[i])
+        if calculated[i] != expected:
+            raise QTError(f"from {starts[i]} to {ends[i]}\n calculated: {calculated[i]}\n expected: {expected}")
+
+
+def test_actual_actual_isma_arrays():
+    print("Testing vectorized actual/actual (ISMA) year fractions...")
+    calendar = UnitedStates(CalendarTypes.UNITED_STATES_GOVERNMENT_BOND)
+    schedule = MakeSchedule().begin(datetime(2017, 1, 10)).with_first_date(datetime(2017, 8, 31)).end(
+        datetime(2026, 2, 28)).with_frequency(Frequency.Semiannual).with_calendar(calendar).with_convention(
+        BusinessDayConvention.Unadjusted).backwards().end_of_month(True).schedule()
+    day_counter = ActualActual(ActualActualConventionTypes.ISMA, schedule)
+
+    starts = [datetime(2017, 1, 10) + timedelta(days=23 * i) for i in range(140)]
+    ends = [min(d + timedelta(days=(61 * i) % 900), datetime(2026, 2, 28)) for i, d in enumerate(starts)]
+    calculated = day_counter.year_fraction_isma_array(np.array(starts, dtype='datetime64[D]'),
+                                                      np.array(ends, dtype='datetime64[D]'))
+    for i in range(len(starts)):
+        expected = day_counter.year_fraction(starts[i], ends[i])
+        if abs(calculated[i] - expected) > 1.0e-12:
+            raise QTError(f"from {starts[i]} to {ends[i]}\n calculated: {calculated[i]}\n expected: {expected}")
+
+
+def test_thirty_360_arrays():
+    print("Testing vectorized 30/360 day counts...")
+    dates = [datetime(2003, 1, 1) + timedelta(days=i) for i in range(0, 1500, 3)]
+    dates += [datetime(y, 2, 28) for y in range(2003, 2008)] + [datetime(2004, 2, 29), datetime(2004, 3, 31)]
+    starts = [dates[i] for i in range(len(dates)) for _ in range(3)]
+    ends = [dates[(7 * i + 11) % len(dates)] for i in range(len(starts))]
+    for convention in Thirty360ConventionTypes:
+        for day_counter in [Thirty360(convention, termination_date=datetime(2004, 2, 29)),
+                            Thirty360(convention, is_last_period=True),
+                            Thirty360(convention, is_last_period=False)]:
+            calculated = day_counter.day_count_array(np.array(starts, dtype='datetime64[D]'),
+                                                     np.array(ends, dtype='datetime64[D]'))
+            for i in range(len(starts)):
+                expected = day_counter.day_count(starts[i], ends[i])
+                if calculated[i] != expected:
+                    raise QTError(f"{day_counter.name()} from {starts[i]} to {ends[i]}\n"
+                                  f" calculated: {calculated[i]}\n expected: {expected}")
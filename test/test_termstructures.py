@@ -0,0 +1,119 @@
+import math
+from datetime import datetime, timedelta
+
+from qtmodel.compounding import Compounding
+from qtmodel.error import QTError
+from qtmodel.handle import Handle, RelinkableHandle
+from qtmodel.math.interpolations.linearinterpolation import Linear
+from qtmodel.quotes.simplequote import SimpleQuote
+from qtmodel.termstructure import _TFR_CACHE_SIZE
+from qtmodel.termstructures.yield_curve.quantotermstructure import QuantoTermStructure
+from qtmodel.termstructures.yield_curve.zerocurve import InterpolatedZeroCurve
+from qtmodel.time.calendars.nullcalendar import NullCalendar
+from qtmodel.time.daycounters.actual365fixed import Actual365Fixed
+from qtmodel.time.frequency import Frequency
+from utilities import flat_rate, flat_vol
+
+
+def test_quanto_term_structure():
+    print("Testing quanto term structure...")
+    today = datetime(2024, 3, 15)
+    dc = Actual365Fixed()
+    tolerance = 1.0e-12
+
+    q = SimpleQuote(0.02)
+    dividend_ts = RelinkableHandle(flat_rate(today, q, dc))
+    risk_free_ts = Handle(flat_rate(today, 0.05, dc))
+    foreign_risk_free_ts = Handle(flat_rate(today, 0.03, dc))
+    underlying_vol_ts = Handle(flat_vol(today, 0.25, dc))
+    exch_rate_vol_ts = Handle(flat_vol(today, 0.10, dc))
+    rho = -0.3
+    quanto_ts = QuantoTermStructure(dividend_ts, risk_free_ts, foreign_risk_free_ts,
+                                    underlying_vol_ts, 100.0, exch_rate_vol_ts, 1.1, rho)
+
+    def check(dividend_yield):
+        expected = dividend_yield + 0.05 - 0.03 + rho * 0.25 * 0.10
+        # repeated times go through the memoized zero yield
+        for t in [0.5, 1.0, 1.0, 2.0, 2.0]:
+            calculated = quanto_ts.zero_rate(t=t, comp=Compounding.Continuous, freq=Frequency.NoFrequency,
+                                             extrapolate=True).rate()
+            if abs(calculated - expected) > tolerance:
+                raise QTError(f"quanto zero rate at t = {t}\n"
+                              f" calculated: {calculated}\n expected: {expected}")
+            calculated = quanto_ts.discount(t)
+            if abs(calculated - math.exp(-expected * t)) > tolerance:
+                raise QTError(f"quanto discount at t = {t}\n"
+                              f" calculated: {calculated}\n expected: {math.exp(-expected * t)}")
+
+    check(0.02)
+
+    # a change in an underlying quote must reset the memoized zero yield
+    q.set_value(0.04)
+    check(0.04)
+
+    # and so must relinking an underlying handle
+    new_today = datetime(2024, 6, 17)
+    dividend_ts.link_to(flat_rate(new_today, 0.01, dc))
+    if quanto_ts.reference_date() != new_today:
+        raise QTError(f"quanto reference date not updated after relinking\n"
+                      f" calculated: {quanto_ts.reference_date()}\n expected: {new_today}")
+    check(0.01)
+
+
+def test_time_from_reference_cache():
+    print("Testing bounded date/time conversion cache...")
+    today = datetime(2024, 3, 15)
+    dc = Actual365Fixed()
+    ts = flat_rate(today, 0.05, dc)
+    for i in range(3 * _TFR_CACHE_SIZE):
+        d = today + timedelta(days=i)
+        calculated = ts.time_from_reference(d)
+        expected = dc.year_fraction(today, d)
+        if calculated != expected:
+            raise QTError(f"time from reference to {d}\n"
+                          f" calculated: {calculated}\n expected: {expected}")
+    if len(ts._tfr_cache) > _TFR_CACHE_SIZE:
+        raise QTError(f"date/time conversion cache holds {len(ts._tfr_cache)} entries, "
+                      f"more than {_TFR_CACHE_SIZE}")
+
+
+def test_linear_zero_curve():
+    print("Testing linear zero curve against the generic interpolation...")
+    today = datetime(2024, 3, 15)
+    dates = [today + timedelta(days=d) for d in (0, 30, 91, 182, 365, 730, 1825)]
+    rates = [0.030, 0.031, 0.033, 0.034, 0.036, 0.037, 0.040]
+    tolerance = 1.0e-14
+
+    for compounding in [Compounding.Continuous, Compounding.Compounded]:
+        def build():
+            curve = InterpolatedZeroCurve(Linear, dates=dates, yields=list(rates),
+                                          day_counter=Actual365Fixed(), calendar=NullCalendar(),
+                                          interpolator=Linear(), compounding=compounding,
+                                          frequency=Frequency.Annual)
+            curve.enable_extrapolation()
+            return curve
+
+        curve = build()
+        # without the segment slopes the curve goes through the interpolation object
+        generic = build()
+        generic._slopes = None
+
+        if list(curve.times_array()) != curve.times() or \
+                list(curve.zero_rates_array()) != curve.zero_rates():
+            raise QTError(f"{compounding} zero curve arrays differ from the node lists")
+        if curve.instantaneous_rate() != curve.zero_rates()[0]:
+            raise QTError(f"{compounding} zero curve instantaneous rate\n"
+                          f" calculated: {curve.instantaneous_rate()}\n expected: {curve.zero_rates()[0]}")
+
+        # up to ten years, well past the last node, to cover the extrapolation
+        for t in [i / 365.0 for i in range(1, 3650, 7)]:
+            calculated = curve.discount(t)
+            expected = generic.discount(t)
+            if abs(calculated - expected) > tolerance:
+                raise QTError(f"{compounding} zero curve discount at t = {t}\n"
+                              f" calculated: {calculated}\n expected: {expected}")
+            calculated = curve.zero_rate(t=t, comp=Compounding.Continuous, freq=Frequency.NoFrequency).rate()
+            expected = generic.zero_rate(t=t, comp=Compounding.Continuous, freq=Frequency.NoFrequency).rate()
+            if abs(calculated - expected) > tolerance:
+                raise QTError(f"{compounding} zero curve zero rate at t = {t}\n"
+                              f" calculated: {calculated}\n expected: {expected}")